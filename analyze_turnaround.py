@@ -6,13 +6,28 @@ Analyzes the burden on teams facing multiple long-haul games in a single playoff
 Useful for modeling tennis tournament structures.
 """
 
+import heapq
 import json
-from collections import defaultdict
-from dataclasses import dataclass
+import sys
+from array import array
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from itertools import compress
+
+# Optional fast JSON codec (falls back to the stdlib json module)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Load the bracket data
-with open("bracket_data.json", "r") as f:
-    data = json.load(f)
+if HAS_ORJSON:
+    with open("bracket_data.json", "rb") as f:
+        data = orjson.loads(f.read())
+else:
+    with open("bracket_data.json", "r") as f:
+        data = json.load(f)
 
 # School locations for distance calculation
 OREGON_SCHOOLS = {
@@ -49,171 +64,225 @@ OREGON_SCHOOLS = {
 
 from math import radians, cos, sin, asin, sqrt
 
-def haversine(lat1, lon1, lat2, lon2):
-    """Calculate distance in miles between two points."""
-    R = 3959
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlat, dlon = lat2 - lat1, lon2 - lon1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    return R * 2 * asin(sqrt(a))
-
-def get_distance(team1, team2):
-    """Get distance between two teams."""
-    if team1 in OREGON_SCHOOLS and team2 in OREGON_SCHOOLS:
-        loc1, loc2 = OREGON_SCHOOLS[team1], OREGON_SCHOOLS[team2]
-        return haversine(loc1[0], loc1[1], loc2[0], loc2[1])
-    return None
+EARTH_RADIUS_MI = 3959
+
+# Column view of OREGON_SCHOOLS (name -> row index, lat/lon in radians) so the
+# whole matchup list can be measured in one batch instead of pair by pair.
+# sin/cos of latitude are cached too, leaving one cos() per pair.
+SCHOOL_INDEX = {name: i for i, name in enumerate(OREGON_SCHOOLS)}
+KNOWN_SCHOOLS = frozenset(OREGON_SCHOOLS)
+SCHOOL_LAT = [radians(lat) for lat, lon in OREGON_SCHOOLS.values()]
+SCHOOL_LON = [radians(lon) for lat, lon in OREGON_SCHOOLS.values()]
+SCHOOL_SIN_LAT = [sin(lat) for lat in SCHOOL_LAT]
+SCHOOL_COS_LAT = [cos(lat) for lat in SCHOOL_LAT]
+
+def _pair_distance(i, j):
+    """Distance in miles between schools at rows i and j of the column view."""
+    # Haversine term rewritten via sin^2(x/2) = (1 - cos x) / 2
+    a = (1 - SCHOOL_SIN_LAT[i] * SCHOOL_SIN_LAT[j]
+         - SCHOOL_COS_LAT[i] * SCHOOL_COS_LAT[j] * cos(SCHOOL_LON[j] - SCHOOL_LON[i])) / 2
+    return EARTH_RADIUS_MI * 2 * asin(sqrt(max(a, 0.0)))
+
+# Every school pair is measured once at import (the table is symmetric, so only
+# i < j is computed); matchups then just index into it with no trig at all
+PAIR_DISTANCES = [[0.0] * len(SCHOOL_INDEX) for _ in SCHOOL_INDEX]
+for i in range(len(SCHOOL_INDEX)):
+    for j in range(i + 1, len(SCHOOL_INDEX)):
+        PAIR_DISTANCES[i][j] = PAIR_DISTANCES[j][i] = _pair_distance(i, j)
+
+def matchup_distances(matchups):
+    """Distance for every matchup in one pass (both teams must be in KNOWN_SCHOOLS)."""
+    # Preallocated flat buffer of doubles, filled in place; globals are bound
+    # to locals so the loop body only does fast local loads
+    distances = array("d", [0.0]) * len(matchups)
+    index, pairs = SCHOOL_INDEX, PAIR_DISTANCES
+    for k, m in enumerate(matchups):
+        distances[k] = pairs[index[m["team1"]]][index[m["team2"]]]
+    return distances
+
+# Eastern Oregon teams (the ones that travel most)
+EASTERN_TEAMS = frozenset({
+    "Pendleton", "Hermiston", "La Grande", "Baker", "Ontario", "Burns",
+    "Enterprise", "Nyssa", "Vale", "Crane", "Joseph", "Grant Union", "Powder Valley",
+})
+
+@dataclass(slots=True)
+class PlayoffGames:
+    """A team's long-haul games in one playoff, one list per game field."""
+    rounds: list = field(default_factory=list)
+    opponents: list = field(default_factory=list)
+    dists: list = field(default_factory=list)
+    homes: list = field(default_factory=list)
+
+    def add(self, round_name, opponent, distance, home):
+        self.rounds.append(round_name)
+        self.opponents.append(opponent)
+        self.dists.append(distance)
+        self.homes.append(home)
 
 # Track team appearances in long-haul games
-team_games = defaultdict(list)  # team -> [(year, sport, div, round, opponent, distance)]
-
-for matchup in data["matchups"]:
-    team1 = matchup["team1"]
-    team2 = matchup["team2"]
-    year = matchup["year"]
-    sport = matchup["sport"]
-    division = matchup["division"]
-    round_name = matchup["round"]
-
-    distance = get_distance(team1, team2)
-    if distance and distance >= 95:
-        key1 = (team1, year, sport, division)
-        key2 = (team2, year, sport, division)
-
-        team_games[key1].append({
-            "round": round_name,
-            "opponent": team2,
-            "distance": distance,
-            "home": True  # team1 is typically home (higher seed)
-        })
-        team_games[key2].append({
-            "round": round_name,
-            "opponent": team1,
-            "distance": distance,
-            "home": False
-        })
-
-# Analyze turnaround burden
-print("=" * 80)
-print("OSAA PLAYOFF TURNAROUND ANALYSIS")
-print("Teams facing multiple long-haul games (95+ mi) in same playoff")
-print("=" * 80)
-
-# Teams with multiple long-haul games in same playoff
-multi_game_teams = {k: v for k, v in team_games.items() if len(v) >= 2}
-
-print(f"\n📊 SUMMARY STATISTICS (2022-2025)")
-print("-" * 40)
+# (team, (year, sport, div)) -> PlayoffGames
+team_games = defaultdict(PlayoffGames)
+
+# Matchups involving a school we have no location for can't be measured;
+# drop them before any distance work
+known_matchups = [m for m in data["matchups"]
+                  if m["team1"] in KNOWN_SCHOOLS and m["team2"] in KNOWN_SCHOOLS]
+
+# Canonical (year, sport, division) tuple per playoff, shared by every key
+# in that playoff so key comparisons short-circuit on identity
+playoff_ids = {}
+
+for matchup, distance in zip(known_matchups, matchup_distances(known_matchups)):
+    if distance >= 95:
+        team1 = matchup["team1"]
+        team2 = matchup["team2"]
+        round_name = matchup["round"]
+        playoff = (matchup["year"], matchup["sport"], matchup["division"])
+        playoff = playoff_ids.setdefault(playoff, playoff)
+
+        # team1 is typically home (higher seed)
+        team_games[team1, playoff].add(round_name, team2, distance, True)
+        team_games[team2, playoff].add(round_name, team1, distance, False)
+
+# Single pass over team_games feeding every rollup reported below
+total_miles_all = 0
+multi_game_count = 0
+# Per-team-playoff columns; team/multi counts are grouped from these after the
+# pass with Counter(), which counts in C rather than per-row `+= 1`
+team_div, team_year, team_multi = [], [], []
+division_miles = defaultdict(float)
+year_games, year_miles = Counter(), defaultdict(float)
+home_games = away_games = 0
+home_miles = away_miles = 0
+# Min-heap of the TOP_CASES worst multi-game cases seen so far, as
+# (total_miles, -seq, case); -seq keeps the earlier case on ties
+TOP_CASES = 15
+worst_heap = []
+eastern_appearances, eastern_miles = Counter(), defaultdict(float)
+
+for (team, (year, sport, div)), games in team_games.items():
+    dists, homes = games.dists, games.homes
+    n_games = len(dists)
+    total_dist = sum(dists)
+    total_miles_all += total_dist
+
+    team_div.append(div)
+    team_year.append(year)
+    team_multi.append(n_games >= 2)
+    division_miles[div] += total_dist
+    year_games[year] += n_games
+    year_miles[year] += total_dist
+
+    n_home = sum(homes)
+    team_home_miles = sum(compress(dists, homes))
+    home_games += n_home
+    home_miles += team_home_miles
+    away_games += n_games - n_home
+    away_miles += total_dist - team_home_miles
+
+    if team in EASTERN_TEAMS:
+        eastern_appearances[team] += 1
+        eastern_miles[team] += total_dist - team_home_miles
+
+    if n_games >= 2:
+        multi_game_count += 1
+        heap_key = (total_dist, -multi_game_count)
+        if len(worst_heap) < TOP_CASES or heap_key > worst_heap[0][:2]:
+            case = {
+                "team": team,
+                "year": year,
+                "sport": sport,
+                "division": div,
+                "games": n_games,
+                "total_miles": total_dist,
+                "details": [
+                    {"round": r, "opponent": o, "distance": d, "home": h}
+                    for r, o, d, h in zip(games.rounds, games.opponents, dists, homes)
+                ]
+            }
+            if len(worst_heap) < TOP_CASES:
+                heapq.heappush(worst_heap, (*heap_key, case))
+            else:
+                heapq.heapreplace(worst_heap, (*heap_key, case))
+
+division_teams, division_multi = Counter(team_div), Counter(compress(team_div, team_multi))
+year_teams, year_multi = Counter(team_year), Counter(compress(team_year, team_multi))
+
+# Analyze turnaround burden (lines are collected and written to stdout once)
+report = []
+report.append("=" * 80)
+report.append("OSAA PLAYOFF TURNAROUND ANALYSIS")
+report.append("Teams facing multiple long-haul games (95+ mi) in same playoff")
+report.append("=" * 80)
+
+report.append(f"\n📊 SUMMARY STATISTICS (2022-2025)")
+report.append("-" * 40)
 total_team_appearances = len(team_games)
-multi_game_count = len(multi_game_teams)
-print(f"Total team-playoff combinations with long-haul: {total_team_appearances}")
-print(f"Teams facing 2+ long-haul games same playoff: {multi_game_count}")
-print(f"Percentage with turnaround burden: {multi_game_count/total_team_appearances*100:.1f}%")
+report.append(f"Total team-playoff combinations with long-haul: {total_team_appearances}")
+report.append(f"Teams facing 2+ long-haul games same playoff: {multi_game_count}")
+report.append(f"Percentage with turnaround burden: {multi_game_count/total_team_appearances*100:.1f}%")
 
 # Calculate total miles traveled
-total_miles_all = sum(sum(g["distance"] for g in games) for games in team_games.values())
 avg_miles_per_team = total_miles_all / total_team_appearances if total_team_appearances else 0
-print(f"\nTotal long-haul miles (all teams): {total_miles_all:,.0f}")
-print(f"Average long-haul miles per team-playoff: {avg_miles_per_team:.1f}")
+report.append(f"\nTotal long-haul miles (all teams): {total_miles_all:,.0f}")
+report.append(f"Average long-haul miles per team-playoff: {avg_miles_per_team:.1f}")
 
 # Breakdown by classification
-print(f"\n📊 BY CLASSIFICATION")
-print("-" * 40)
-by_division = defaultdict(lambda: {"teams": 0, "multi": 0, "total_miles": 0})
-for (team, year, sport, div), games in team_games.items():
-    by_division[div]["teams"] += 1
-    by_division[div]["total_miles"] += sum(g["distance"] for g in games)
-    if len(games) >= 2:
-        by_division[div]["multi"] += 1
-
+report.append(f"\n📊 BY CLASSIFICATION")
+report.append("-" * 40)
 for div in ["6A", "5A", "4A", "3A", "2A/1A"]:
-    stats = by_division[div]
-    if stats["teams"] > 0:
-        pct = stats["multi"] / stats["teams"] * 100
-        avg = stats["total_miles"] / stats["teams"]
-        print(f"{div}: {stats['teams']} teams, {stats['multi']} with 2+ games ({pct:.0f}%), avg {avg:.0f} mi")
+    teams, multi = division_teams[div], division_multi[div]
+    if teams > 0:
+        pct = multi / teams * 100
+        avg = division_miles[div] / teams
+        report.append(f"{div}: {teams} teams, {multi} with 2+ games ({pct:.0f}%), avg {avg:.0f} mi")
 
 # Worst turnaround cases
-print(f"\n🔴 WORST TURNAROUND CASES (2+ long-haul games)")
-print("-" * 40)
-
-worst_cases = []
-for (team, year, sport, div), games in multi_game_teams.items():
-    total_dist = sum(g["distance"] for g in games)
-    worst_cases.append({
-        "team": team,
-        "year": year,
-        "sport": sport,
-        "division": div,
-        "games": len(games),
-        "total_miles": total_dist,
-        "details": games
-    })
-
-worst_cases.sort(key=lambda x: x["total_miles"], reverse=True)
-
-for i, case in enumerate(worst_cases[:15], 1):
-    print(f"\n{i}. {case['team']} ({case['year']} {case['sport'].title()} {case['division']})")
-    print(f"   Total travel burden: {case['total_miles']:.0f} miles across {case['games']} long-haul games")
+report.append(f"\n🔴 WORST TURNAROUND CASES (2+ long-haul games)")
+report.append("-" * 40)
+
+top_cases = [case for *_, case in sorted(worst_heap, reverse=True)]
+
+for i, case in enumerate(top_cases, 1):
+    report.append(f"\n{i}. {case['team']} ({case['year']} {case['sport'].title()} {case['division']})")
+    report.append(f"   Total travel burden: {case['total_miles']:.0f} miles across {case['games']} long-haul games")
     for g in case["details"]:
         home_away = "HOME" if g["home"] else "AWAY"
-        print(f"   - {g['round']}: vs {g['opponent']} ({g['distance']:.0f} mi) [{home_away}]")
+        report.append(f"   - {g['round']}: vs {g['opponent']} ({g['distance']:.0f} mi) [{home_away}]")
 
 # Year-over-year trends
-print(f"\n📈 YEAR-OVER-YEAR TRENDS")
-print("-" * 40)
-by_year = defaultdict(lambda: {"teams": 0, "multi": 0, "total_miles": 0, "games": 0})
-for (team, year, sport, div), games in team_games.items():
-    by_year[year]["teams"] += 1
-    by_year[year]["games"] += len(games)
-    by_year[year]["total_miles"] += sum(g["distance"] for g in games)
-    if len(games) >= 2:
-        by_year[year]["multi"] += 1
-
-for year in sorted(by_year.keys()):
-    stats = by_year[year]
-    pct = stats["multi"] / stats["teams"] * 100 if stats["teams"] else 0
-    avg = stats["total_miles"] / stats["teams"] if stats["teams"] else 0
-    print(f"{year}: {stats['teams']} teams affected, {stats['multi']} with 2+ games ({pct:.0f}%), avg {avg:.0f} mi/team")
+report.append(f"\n📈 YEAR-OVER-YEAR TRENDS")
+report.append("-" * 40)
+for year in sorted(year_teams):
+    teams, multi = year_teams[year], year_multi[year]
+    pct = multi / teams * 100 if teams else 0
+    avg = year_miles[year] / teams if teams else 0
+    report.append(f"{year}: {teams} teams affected, {multi} with 2+ games ({pct:.0f}%), avg {avg:.0f} mi/team")
 
 # Home vs Away burden
-print(f"\n🏠 HOME VS AWAY BURDEN")
-print("-" * 40)
-home_games = sum(1 for games in team_games.values() for g in games if g["home"])
-away_games = sum(1 for games in team_games.values() for g in games if not g["home"])
-home_miles = sum(g["distance"] for games in team_games.values() for g in games if g["home"])
-away_miles = sum(g["distance"] for games in team_games.values() for g in games if not g["home"])
-
-print(f"Home teams hosting long-haul opponents: {home_games} games")
-print(f"Away teams traveling long distances: {away_games} games, {away_miles:,.0f} total miles")
-print(f"Average away travel per game: {away_miles/away_games:.0f} miles" if away_games else "")
+report.append(f"\n🏠 HOME VS AWAY BURDEN")
+report.append("-" * 40)
+report.append(f"Home teams hosting long-haul opponents: {home_games} games")
+report.append(f"Away teams traveling long distances: {away_games} games, {away_miles:,.0f} total miles")
+report.append(f"Average away travel per game: {away_miles/away_games:.0f} miles" if away_games else "")
 
 # Eastern Oregon burden (teams that travel most)
-print(f"\n🗺️  GEOGRAPHIC BURDEN - EASTERN OREGON TEAMS")
-print("-" * 40)
-eastern_teams = ["Pendleton", "Hermiston", "La Grande", "Baker", "Ontario", "Burns",
-                 "Enterprise", "Nyssa", "Vale", "Crane", "Joseph", "Grant Union", "Powder Valley"]
-
-eastern_burden = defaultdict(lambda: {"appearances": 0, "total_miles": 0})
-for (team, year, sport, div), games in team_games.items():
-    if team in eastern_teams:
-        away_miles = sum(g["distance"] for g in games if not g["home"])
-        eastern_burden[team]["appearances"] += 1
-        eastern_burden[team]["total_miles"] += away_miles
-
-print("Team                  | Playoff Appearances | Total Away Miles | Avg per Playoff")
-print("-" * 75)
-for team in sorted(eastern_burden.keys(), key=lambda t: eastern_burden[t]["total_miles"], reverse=True):
-    stats = eastern_burden[team]
-    avg = stats["total_miles"] / stats["appearances"] if stats["appearances"] else 0
-    print(f"{team:20} | {stats['appearances']:^19} | {stats['total_miles']:^16.0f} | {avg:^15.0f}")
+report.append(f"\n🗺️  GEOGRAPHIC BURDEN - EASTERN OREGON TEAMS")
+report.append("-" * 40)
+report.append("Team                  | Playoff Appearances | Total Away Miles | Avg per Playoff")
+report.append("-" * 75)
+for team in sorted(eastern_miles, key=eastern_miles.__getitem__, reverse=True):
+    appearances, miles = eastern_appearances[team], eastern_miles[team]
+    avg = miles / appearances if appearances else 0
+    report.append(f"{team:20} | {appearances:^19} | {miles:^16.0f} | {avg:^15.0f}")
 
 # Model for Tennis
-print(f"\n" + "=" * 80)
-print("🎾 IMPLICATIONS FOR TENNIS TOURNAMENT DESIGN")
-print("=" * 80)
+report.append(f"\n" + "=" * 80)
+report.append("🎾 IMPLICATIONS FOR TENNIS TOURNAMENT DESIGN")
+report.append("=" * 80)
 
-print("""
+report.append("""
 KEY FINDINGS FROM BASEBALL/SOFTBALL:
 1. {:.0f}% of teams in long-haul matchups face 2+ such games per playoff
 2. Average travel burden: {:.0f} miles per affected team
@@ -248,12 +317,24 @@ summary = {
     "turnaround_burden_percentage": round(multi_game_count/total_team_appearances*100, 1) if total_team_appearances else 0,
     "total_longhaul_miles": round(total_miles_all),
     "avg_miles_per_team": round(avg_miles_per_team, 1),
-    "by_division": {div: dict(stats) for div, stats in by_division.items()},
-    "by_year": {year: dict(stats) for year, stats in by_year.items()},
-    "worst_cases": worst_cases[:10]
+    "by_division": {
+        div: {"teams": teams, "multi": division_multi[div], "total_miles": division_miles[div]}
+        for div, teams in division_teams.items()
+    },
+    "by_year": {
+        str(year): {"teams": teams, "multi": year_multi[year], "total_miles": year_miles[year], "games": year_games[year]}
+        for year, teams in year_teams.items()
+    },
+    "worst_cases": top_cases[:10]
 }
 
-with open("turnaround_analysis.json", "w") as f:
-    json.dump(summary, f, indent=2)
+if HAS_ORJSON:
+    with open("turnaround_analysis.json", "wb") as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+else:
+    with open("turnaround_analysis.json", "w") as f:
+        f.write(json.dumps(summary, indent=2))
+
+report.append("\n✅ Analysis exported to turnaround_analysis.json")
 
-print("\n✅ Analysis exported to turnaround_analysis.json")
+sys.stdout.write("\n".join(report) + "\n")
@@ -8,24 +8,59 @@ OSAA Playoff Brackets -> Interactive Webpage
 * Generates static HTML with optional CSV download
 """
 
+import atexit
 import csv
+import hashlib
 import json
+import os
+import re
+import sys
+import threading
 import time
 import urllib.parse
-import re
-from pathlib import Path
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import compress
+from math import radians, cos, sin, asin, sqrt, hypot, pi
+from operator import attrgetter
+from pathlib import Path
 from typing import Optional
-from math import radians, cos, sin, asin, sqrt
 
 # Optional imports for web scraping (not required for JSON loading)
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from bs4 import BeautifulSoup
     HAS_SCRAPING = True
 except ImportError:
     HAS_SCRAPING = False
 
+# lxml is a much faster BeautifulSoup backend than the stdlib html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# orjson is a faster drop-in for reading bracket data and writing the page
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional geocoder for schools missing from schools.json
+try:
+    from geopy.geocoders import Nominatim
+    HAS_GEOCODER = True
+except ImportError:
+    HAS_GEOCODER = False
+
 # ------------------- CONFIG -------------------
 # Only tracking baseball and softball
 SPORTS = {
@@ -49,272 +84,101 @@ TIER_YELLOW = 249   # <= 249 miles: Yellow (moderate long-haul)
 # > 249 miles: Red (longest travel)
 
 OSAA_BASE_URL = "https://www.osaa.org"
+USER_AGENT = "Mozilla/5.0 (compatible; OSAA Brackets Scraper/1.0)"
+
+# Brackets are fetched concurrently; request starts are still spaced at least
+# REQUEST_INTERVAL seconds apart across all workers, the same 2 requests/s the
+# serial scraper allowed, so workers only overlap slow responses
+SCRAPE_WORKERS = 8
+REQUEST_INTERVAL = 0.5
+_request_lock = threading.Lock()
+_next_request_at = 0.0
+
+# Shared HTTP session so every bracket request to OSAA reuses pooled
+# keep-alive connections (one TLS handshake instead of one per URL)
+SESSION = None
+if HAS_SCRAPING:
+    SESSION = requests.Session()
+    SESSION.headers.update({"User-Agent": USER_AGENT})
+    SESSION.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ))
+
+# CSS selectors for bracket page elements; [class*=...] keeps the substring
+# matching of the old class regexes (e.g. "bracket-game" matches "game")
+_SEL_GAME = '[class*="game"], [class*="matchup"]'
+_SEL_TABLE = 'table[class*="bracket"], table[class*="schedule"], table[class*="playoff"]'
+_SEL_TEAM = '[class*="team"], [class*="school"], [class*="participant"]'
+_SEL_SCORE = '[class*="score"], [class*="result"]'
+_SEL_ROUND = '[class*="round"], [class*="stage"]'
+_SEL_LOC = '[class*="location"], [class*="venue"], [class*="site"]'
+
+# Patterns used while parsing bracket pages, compiled once at import
+_RE_SEED_PREFIX = re.compile(r"^[#(\[]?(\d+)[)\].]?\s*(.+)$")
+_RE_SEED_SUFFIX = re.compile(r"^(.+?)\s*[#(\[]?(\d+)[)\]]?$")
+_RE_VS = re.compile(r"\s+(?:vs?\.?|@)\s+", re.IGNORECASE)
+_RE_SCORE = re.compile(r"^\d+-\d+$")
+_RE_DIGITS = re.compile(r"^\d+$")
+# Common neutral site indicators, matched against the lowercased location
+_NEUTRAL_RE = re.compile(
+    r"university|college|civic|stadium|state|volcanoes|pk park|jane sanders|hillsboro hops"
+)
 
 # Cache for geocoding results
 GEOCODE_CACHE_FILE = Path("geocode_cache.json")
+GEOCODE_INTERVAL = 1.0  # Nominatim usage policy: at most one request per second
+_GEOCODE_LOCK = threading.Lock()  # Nominatim allows one lookup at a time
+_last_geocode_at = 0.0
+ALLOW_GEOCODE = False  # live lookups are opt-in (--geocode); cached results are always used
 
-# Oregon school locations (pre-populated for common schools)
-OREGON_SCHOOLS = {
-    # Portland Metro
-    "Lincoln": {"city": "Portland", "lat": 45.5152, "lon": -122.6784},
-    "Grant": {"city": "Portland", "lat": 45.5432, "lon": -122.6306},
-    "Benson": {"city": "Portland", "lat": 45.5280, "lon": -122.6558},
-    "Cleveland": {"city": "Portland", "lat": 45.4970, "lon": -122.6306},
-    "Franklin": {"city": "Portland", "lat": 45.4849, "lon": -122.6127},
-    "Jefferson": {"city": "Portland", "lat": 45.5470, "lon": -122.6700},
-    "Roosevelt": {"city": "Portland", "lat": 45.5861, "lon": -122.7516},
-    "Wilson": {"city": "Portland", "lat": 45.4685, "lon": -122.7106},
-    "Madison": {"city": "Portland", "lat": 45.5306, "lon": -122.5693},
-    "Westview": {"city": "Portland", "lat": 45.5436, "lon": -122.8477},
-    "Sunset": {"city": "Beaverton", "lat": 45.5118, "lon": -122.8230},
-    "Southridge": {"city": "Beaverton", "lat": 45.4635, "lon": -122.8158},
-    "Mountainside": {"city": "Beaverton", "lat": 45.4461, "lon": -122.8358},
-    "Jesuit": {"city": "Beaverton", "lat": 45.4914, "lon": -122.7837},
-    "Tigard": {"city": "Tigard", "lat": 45.4312, "lon": -122.7714},
-    "Tualatin": {"city": "Tualatin", "lat": 45.3838, "lon": -122.7637},
-    "Lake Oswego": {"city": "Lake Oswego", "lat": 45.4107, "lon": -122.6706},
-    "Lakeridge": {"city": "Lake Oswego", "lat": 45.3941, "lon": -122.6872},
-    "West Linn": {"city": "West Linn", "lat": 45.3651, "lon": -122.6120},
-    "Clackamas": {"city": "Clackamas", "lat": 45.4107, "lon": -122.5706},
-    "Oregon City": {"city": "Oregon City", "lat": 45.3573, "lon": -122.6068},
-    "Central Catholic": {"city": "Portland", "lat": 45.5306, "lon": -122.6206},
-    "Barlow": {"city": "Gresham", "lat": 45.4881, "lon": -122.4302},
-    "Gresham": {"city": "Gresham", "lat": 45.5023, "lon": -122.4306},
-    "David Douglas": {"city": "Portland", "lat": 45.4906, "lon": -122.5106},
-    "Reynolds": {"city": "Troutdale", "lat": 45.5387, "lon": -122.3868},
-    "Centennial": {"city": "Gresham", "lat": 45.5006, "lon": -122.4606},
-    "Parkrose": {"city": "Portland", "lat": 45.5506, "lon": -122.5306},
-    "Sherwood": {"city": "Sherwood", "lat": 45.3573, "lon": -122.8406},
-    "Newberg": {"city": "Newberg", "lat": 45.3007, "lon": -122.9730},
-    "McMinnville": {"city": "McMinnville", "lat": 45.2101, "lon": -123.1868},
-    "Forest Grove": {"city": "Forest Grove", "lat": 45.5190, "lon": -123.1106},
-    "Glencoe": {"city": "Hillsboro", "lat": 45.5290, "lon": -122.9706},
-    "Century": {"city": "Hillsboro", "lat": 45.5190, "lon": -122.9406},
-    "Liberty": {"city": "Hillsboro", "lat": 45.5390, "lon": -123.0106},
-    "Hillsboro": {"city": "Hillsboro", "lat": 45.5229, "lon": -122.9898},
-    "Wilsonville": {"city": "Wilsonville", "lat": 45.3001, "lon": -122.7737},
-    "Canby": {"city": "Canby", "lat": 45.2629, "lon": -122.6920},
-    "St. Helens": {"city": "St. Helens", "lat": 45.8640, "lon": -122.8065},
-    "Scappoose": {"city": "Scappoose", "lat": 45.7540, "lon": -122.8765},
-
-    # Salem Area
-    "Sprague": {"city": "Salem", "lat": 44.9429, "lon": -123.0351},
-    "South Salem": {"city": "Salem", "lat": 44.9129, "lon": -123.0351},
-    "West Salem": {"city": "Salem", "lat": 44.9529, "lon": -123.0651},
-    "McKay": {"city": "Salem", "lat": 44.9829, "lon": -123.0151},
-    "McNary": {"city": "Keizer", "lat": 45.0029, "lon": -123.0251},
-    "North Salem": {"city": "Salem", "lat": 44.9629, "lon": -123.0251},
-    "Central": {"city": "Independence", "lat": 44.8512, "lon": -123.1868},
-    "Dallas": {"city": "Dallas", "lat": 44.9193, "lon": -123.3151},
-    "Silverton": {"city": "Silverton", "lat": 45.0051, "lon": -122.7830},
-    "Woodburn": {"city": "Woodburn", "lat": 45.1437, "lon": -122.8562},
-    "Kennedy": {"city": "Mt. Angel", "lat": 45.0701, "lon": -122.8006},
-
-    # Eugene Area
-    "Sheldon": {"city": "Eugene", "lat": 44.0929, "lon": -123.0851},
-    "South Eugene": {"city": "Eugene", "lat": 44.0329, "lon": -123.0851},
-    "Churchill": {"city": "Eugene", "lat": 44.0229, "lon": -123.1251},
-    "North Eugene": {"city": "Eugene", "lat": 44.0729, "lon": -123.1051},
-    "Marist Catholic": {"city": "Eugene", "lat": 44.0129, "lon": -123.0651},
-    "Willamette": {"city": "Eugene", "lat": 44.0529, "lon": -123.0651},
-    "Springfield": {"city": "Springfield", "lat": 44.0462, "lon": -122.9841},
-    "Thurston": {"city": "Springfield", "lat": 44.0462, "lon": -122.9241},
-
-    # Corvallis/Albany Area
-    "Corvallis": {"city": "Corvallis", "lat": 44.5646, "lon": -123.2620},
-    "Crescent Valley": {"city": "Corvallis", "lat": 44.5846, "lon": -123.2420},
-    "South Albany": {"city": "Albany", "lat": 44.6101, "lon": -123.1051},
-    "West Albany": {"city": "Albany", "lat": 44.6301, "lon": -123.1251},
-    "Lebanon": {"city": "Lebanon", "lat": 44.5368, "lon": -122.9065},
-    "Philomath": {"city": "Philomath", "lat": 44.5401, "lon": -123.3651},
-
-    # Bend/Central Oregon
-    "Bend": {"city": "Bend", "lat": 44.0582, "lon": -121.3153},
-    "Summit": {"city": "Bend", "lat": 44.0882, "lon": -121.3053},
-    "Mountain View": {"city": "Bend", "lat": 44.0282, "lon": -121.3253},
-    "Caldera": {"city": "Bend", "lat": 44.0382, "lon": -121.3453},
-    "Ridgeview": {"city": "Redmond", "lat": 44.2726, "lon": -121.1740},
-    "Redmond": {"city": "Redmond", "lat": 44.2726, "lon": -121.1740},
-    "Sisters": {"city": "Sisters", "lat": 44.2901, "lon": -121.5490},
-    "La Pine": {"city": "La Pine", "lat": 43.6701, "lon": -121.5040},
-    "Madras": {"city": "Madras", "lat": 44.6326, "lon": -121.1293},
-    "Crook County": {"city": "Prineville", "lat": 44.2993, "lon": -120.8340},
-
-    # Southern Oregon
-    "South Medford": {"city": "Medford", "lat": 42.3165, "lon": -122.8756},
-    "North Medford": {"city": "Medford", "lat": 42.3465, "lon": -122.8556},
-    "Crater": {"city": "Central Point", "lat": 42.3757, "lon": -122.9062},
-    "Grants Pass": {"city": "Grants Pass", "lat": 42.4390, "lon": -123.3284},
-    "Roseburg": {"city": "Roseburg", "lat": 43.2165, "lon": -123.3417},
-    "Ashland": {"city": "Ashland", "lat": 42.1946, "lon": -122.7095},
-    "Phoenix": {"city": "Phoenix", "lat": 42.2746, "lon": -122.8195},
-    "Hidden Valley": {"city": "Grants Pass", "lat": 42.4090, "lon": -123.3584},
-    "North Valley": {"city": "Merlin", "lat": 42.5190, "lon": -123.4084},
-    "St. Mary's, Medford": {"city": "Medford", "lat": 42.3265, "lon": -122.8656},
-    "Klamath Union": {"city": "Klamath Falls", "lat": 42.2249, "lon": -121.7817},
-    "Henley": {"city": "Klamath Falls", "lat": 42.1649, "lon": -121.7317},
-    "Mazama": {"city": "Klamath Falls", "lat": 42.2049, "lon": -121.8017},
-
-    # Coast
-    "Marshfield": {"city": "Coos Bay", "lat": 43.3665, "lon": -124.2179},
-    "North Bend": {"city": "North Bend", "lat": 43.4065, "lon": -124.2240},
-    "Siuslaw": {"city": "Florence", "lat": 43.9826, "lon": -124.0990},
-    "Brookings-Harbor": {"city": "Brookings", "lat": 42.0526, "lon": -124.2840},
-    "Seaside": {"city": "Seaside", "lat": 45.9932, "lon": -123.9226},
-    "Astoria": {"city": "Astoria", "lat": 46.1879, "lon": -123.8313},
-    "Tillamook": {"city": "Tillamook", "lat": 45.4562, "lon": -123.8426},
-    "Newport": {"city": "Newport", "lat": 44.6368, "lon": -124.0534},
-    "Taft": {"city": "Lincoln City", "lat": 44.9568, "lon": -124.0134},
-
-    # Eastern Oregon
-    "Pendleton": {"city": "Pendleton", "lat": 45.6721, "lon": -118.7886},
-    "La Grande": {"city": "La Grande", "lat": 45.3246, "lon": -118.0877},
-    "Baker": {"city": "Baker City", "lat": 44.7749, "lon": -117.8344},
-    "Ontario": {"city": "Ontario", "lat": 44.0265, "lon": -116.9629},
-    "Vale": {"city": "Vale", "lat": 43.9818, "lon": -117.2384},
-    "Nyssa": {"city": "Nyssa", "lat": 43.8765, "lon": -116.9929},
-    # Note: Pendleton left OSAA for WIAA in 2018-19 due to travel hardships
-    "The Dalles": {"city": "The Dalles", "lat": 45.5946, "lon": -121.1787},
-    "Hood River Valley": {"city": "Hood River", "lat": 45.7101, "lon": -121.5140},
-    "Enterprise": {"city": "Enterprise", "lat": 45.4265, "lon": -117.2790},
-    "Irrigon": {"city": "Irrigon", "lat": 45.8965, "lon": -119.4929},
-    "Weston-McEwen/Griswold": {"city": "Athena", "lat": 45.8165, "lon": -118.4890},
-
-    # Additional Schools for Bracket Data
-    "Cascade": {"city": "Turner", "lat": 44.8462, "lon": -122.9506},
-    "Burns": {"city": "Burns", "lat": 43.5865, "lon": -119.0540},
-    "Yamhill-Carlton": {"city": "Yamhill", "lat": 45.3418, "lon": -123.1868},
-    "Santiam Christian": {"city": "Adair Village", "lat": 44.6701, "lon": -123.2251},
-    "Cascade Christian": {"city": "Medford", "lat": 42.3265, "lon": -122.8756},
-    "South Umpqua": {"city": "Myrtle Creek", "lat": 42.9718, "lon": -123.2934},
-    "Gaston": {"city": "Gaston", "lat": 45.4340, "lon": -123.2568},
-    "Knappa": {"city": "Knappa", "lat": 46.1823, "lon": -123.5940},
-    "Joseph": {"city": "Joseph", "lat": 45.3540, "lon": -117.2295},
-    "Crane": {"city": "Crane", "lat": 43.4118, "lon": -118.5868},
-    "Grant Union": {"city": "John Day", "lat": 44.4165, "lon": -118.9529},
-    "Powder Valley": {"city": "North Powder", "lat": 45.0318, "lon": -117.9340},
-    "Dayton": {"city": "Dayton", "lat": 45.2201, "lon": -123.0768},
-    "Rainier": {"city": "Rainier", "lat": 46.0890, "lon": -122.9365},
-    "Vernonia": {"city": "Vernonia", "lat": 45.8590, "lon": -123.1929},
-    "Bandon": {"city": "Bandon", "lat": 43.1190, "lon": -124.4087},
-    "Joseph": {"city": "Joseph", "lat": 45.3540, "lon": -117.2295},
-
-    # Private Schools
-    "Oregon Episcopal": {"city": "Portland", "lat": 45.4706, "lon": -122.7306},
-    "Catlin Gabel": {"city": "Portland", "lat": 45.4806, "lon": -122.7806},
-    "Valley Catholic": {"city": "Beaverton", "lat": 45.4614, "lon": -122.8058},
-    "La Salle Prep": {"city": "Milwaukie", "lat": 45.4407, "lon": -122.6306},
-    "De La Salle North Catholic": {"city": "Portland", "lat": 45.5706, "lon": -122.6806},
-
-    # Additional Schools from 2024-2025 Brackets
-    "Banks": {"city": "Banks", "lat": 45.6190, "lon": -123.1129},
-    "Blanchet Catholic": {"city": "Salem", "lat": 44.9429, "lon": -123.0151},
-    "Clatskanie": {"city": "Clatskanie", "lat": 46.1040, "lon": -123.2065},
-    "Cottage Grove": {"city": "Cottage Grove", "lat": 43.7973, "lon": -123.0596},
-    "Creswell": {"city": "Creswell", "lat": 43.9173, "lon": -123.0251},
-    "Douglas": {"city": "Winston", "lat": 43.1218, "lon": -123.4168},
-    "Eagle Point": {"city": "Eagle Point", "lat": 42.4721, "lon": -122.8029},
-    "Echo": {"city": "Echo", "lat": 45.7440, "lon": -119.1929},
-    "Elgin": {"city": "Elgin", "lat": 45.5665, "lon": -117.9190},
-    "Estacada": {"city": "Estacada", "lat": 45.2901, "lon": -122.3351},
-    "Gervais": {"city": "Gervais", "lat": 45.1101, "lon": -122.8968},
-    "Glendale": {"city": "Glendale", "lat": 42.7365, "lon": -123.4234},
-    "Harrisburg": {"city": "Harrisburg", "lat": 44.2740, "lon": -123.1696},
-    "Heppner": {"city": "Heppner", "lat": 45.3540, "lon": -119.5565},
-    "Illinois Valley": {"city": "Cave Junction", "lat": 42.1626, "lon": -123.6484},
-    "Junction City": {"city": "Junction City", "lat": 44.2190, "lon": -123.2051},
-    "Lakeview": {"city": "Lakeview", "lat": 42.1890, "lon": -120.3465},
-    "Lost River": {"city": "Merrill", "lat": 42.0290, "lon": -121.6017},
-    "Lowell": {"city": "Lowell", "lat": 43.9173, "lon": -122.7851},
-    "McLoughlin": {"city": "Milton-Freewater", "lat": 45.9340, "lon": -118.3890},
-    "Myrtle Point": {"city": "Myrtle Point", "lat": 43.0665, "lon": -124.1379},
-    "North Douglas": {"city": "Drain", "lat": 43.6618, "lon": -123.3168},
-    "Perrydale": {"city": "Perrydale", "lat": 44.9690, "lon": -123.2268},
-    "Pleasant Hill": {"city": "Pleasant Hill", "lat": 43.9573, "lon": -122.9551},
-    "Powers": {"city": "Powers", "lat": 42.8765, "lon": -124.0640},
-    "Salem Academy": {"city": "Salem", "lat": 44.9429, "lon": -123.0351},
-    "Sandy": {"city": "Sandy", "lat": 45.3973, "lon": -122.2612},
-    "Santiam": {"city": "Mill City", "lat": 44.7540, "lon": -122.4751},
-    "Scio": {"city": "Scio", "lat": 44.7390, "lon": -122.8451},
-    "Stayton": {"city": "Stayton", "lat": 44.8012, "lon": -122.7930},
-    "Sweet Home": {"city": "Sweet Home", "lat": 44.3973, "lon": -122.7351},
-    "Toledo": {"city": "Toledo", "lat": 44.6212, "lon": -123.9365},
-    "Union": {"city": "Union", "lat": 45.2065, "lon": -117.8640},
-    "Weston-McEwen": {"city": "Athena", "lat": 45.8165, "lon": -118.4890},
-    "Willamina": {"city": "Willamina", "lat": 45.0790, "lon": -123.4868},
-    "Amity": {"city": "Amity", "lat": 45.1140, "lon": -123.2068},
-    "Culver": {"city": "Culver", "lat": 44.5290, "lon": -121.2140},
-    "Elmira": {"city": "Elmira", "lat": 44.0873, "lon": -123.3951},
-    "Glide": {"city": "Glide", "lat": 43.3018, "lon": -123.1017},
-    "Monroe": {"city": "Monroe", "lat": 44.3190, "lon": -123.2951},
-    "Nelson": {"city": "Happy Valley", "lat": 45.4407, "lon": -122.5106},
-    "Oakland": {"city": "Oakland", "lat": 43.4218, "lon": -123.3051},
-    "Oakridge": {"city": "Oakridge", "lat": 43.7473, "lon": -122.4651},
-    "Pilot Rock": {"city": "Pilot Rock", "lat": 45.4840, "lon": -118.8390},
-    "Reedsport": {"city": "Reedsport", "lat": 43.7023, "lon": -124.0965},
-    "Coquille": {"city": "Coquille", "lat": 43.1773, "lon": -124.1879},
-    "Corbett": {"city": "Corbett", "lat": 45.5140, "lon": -122.2612},
-    "Days Creek": {"city": "Days Creek", "lat": 42.9618, "lon": -123.1434},
-    "Neah-Kah-Nie": {"city": "Rockaway Beach", "lat": 45.6132, "lon": -123.9426},
-    "Nestucca": {"city": "Cloverdale", "lat": 45.2101, "lon": -123.8826},
-    "Putnam": {"city": "Milwaukie", "lat": 45.4307, "lon": -122.6206},
-    "Rogue River": {"city": "Rogue River", "lat": 42.4390, "lon": -123.1718},
-    "Warrenton": {"city": "Warrenton", "lat": 46.1679, "lon": -123.9226},
-    "Country Christian": {"city": "Molalla", "lat": 45.1501, "lon": -122.5768},
-    "Gladstone": {"city": "Gladstone", "lat": 45.3807, "lon": -122.5906},
-    "Horizon Christian, Tualatin": {"city": "Tualatin", "lat": 45.3838, "lon": -122.7637},
-    "Ida B. Wells": {"city": "Portland", "lat": 45.4906, "lon": -122.6906},
-    "North Marion": {"city": "Aurora", "lat": 45.2301, "lon": -122.7568},
-    "Portland Christian": {"city": "Portland", "lat": 45.4806, "lon": -122.5506},
-    "Regis": {"city": "Stayton", "lat": 44.8012, "lon": -122.7930},
-    "St. Paul": {"city": "St. Paul", "lat": 45.2101, "lon": -122.9768},
-    "Umpqua Valley Christian": {"city": "Roseburg", "lat": 43.2265, "lon": -123.3517},
-    "Molalla": {"city": "Molalla", "lat": 45.1501, "lon": -122.5768},
-    "Siuslaw": {"city": "Florence", "lat": 43.9826, "lon": -124.0990},
-    "Mountain View": {"city": "Bend", "lat": 44.0282, "lon": -121.3253},
-    "Crosspoint Christian": {"city": "Oregon City", "lat": 45.3573, "lon": -122.6068},
-    "Aloha": {"city": "Aloha", "lat": 45.4918, "lon": -122.8706},
-
-    # Additional schools from 2014-2019 data
-    "Beaverton": {"city": "Beaverton", "lat": 45.4871, "lon": -122.8037},
-    "Bonanza": {"city": "Bonanza", "lat": 42.2012, "lon": -121.4073},
-    "Butte Falls": {"city": "Butte Falls", "lat": 42.5437, "lon": -122.5678},
-    "Central Linn": {"city": "Halsey", "lat": 44.3879, "lon": -123.1062},
-    "Colton": {"city": "Colton", "lat": 45.1701, "lon": -122.4312},
-    "Gold Beach": {"city": "Gold Beach", "lat": 42.4073, "lon": -124.4234},
-    "Hermiston": {"city": "Hermiston", "lat": 45.8401, "lon": -119.2895},
-    "Riddle": {"city": "Riddle", "lat": 42.9493, "lon": -123.3634},
-    "Sutherlin": {"city": "Sutherlin", "lat": 43.3901, "lon": -123.3123},
-    "Waldport": {"city": "Waldport", "lat": 44.4268, "lon": -124.0668},
-    "Western Mennonite": {"city": "Salem", "lat": 44.9429, "lon": -123.0351},
-    "Dufur": {"city": "Dufur", "lat": 45.4565, "lon": -121.1240},
-    "Hosanna Christian": {"city": "Klamath Falls", "lat": 42.2249, "lon": -121.7817},
-    "Siletz Valley": {"city": "Siletz", "lat": 44.7212, "lon": -123.9212},
-    "Stanfield": {"city": "Stanfield", "lat": 45.7779, "lon": -119.2151},
-    "Arlington": {"city": "Arlington", "lat": 45.7212, "lon": -120.1984},
-    "Sherman": {"city": "Moro", "lat": 45.4840, "lon": -120.7340},
-    "Riverside": {"city": "Boardman", "lat": 45.8390, "lon": -119.7006},
-    "Crow": {"city": "Crow", "lat": 43.9568, "lon": -123.4051},
-    "Prospect": {"city": "Prospect", "lat": 42.7512, "lon": -122.4868},
-    "Cove": {"city": "Cove", "lat": 45.3001, "lon": -117.8140},
-    "Pilot Rock": {"city": "Pilot Rock", "lat": 45.4840, "lon": -118.8390},
-    "South Wasco": {"city": "Maupin", "lat": 45.1765, "lon": -121.0840},
-    "Eddyville": {"city": "Eddyville", "lat": 44.6168, "lon": -123.8068},
-    "Crater Lake": {"city": "Chiloquin", "lat": 42.5790, "lon": -121.8617},
-    "Nixyaawii": {"city": "Pendleton", "lat": 45.6721, "lon": -118.7886},
-    "Yoncalla": {"city": "Yoncalla", "lat": 43.5965, "lon": -123.2817},
-    "Elkton": {"city": "Elkton", "lat": 43.6318, "lon": -123.5534},
-    "Triangle Lake": {"city": "Blachly", "lat": 44.0868, "lon": -123.5851},
-    "Condon": {"city": "Condon", "lat": 45.2337, "lon": -120.1851},
-    "Prairie City": {"city": "Prairie City", "lat": 44.4590, "lon": -118.7068},
-    "Wallowa": {"city": "Wallowa", "lat": 45.5712, "lon": -117.5290},
-    "Ione": {"city": "Ione", "lat": 45.4965, "lon": -119.8268},
-    "Milwaukie": {"city": "Milwaukie", "lat": 45.4451, "lon": -122.6306},
-    "Faith Bible": {"city": "Hillsboro", "lat": 45.5229, "lon": -122.9898},
-}
+# Oregon school locations (pre-populated for common schools), kept as data in
+# schools.json next to this script: {name: {"city", "lat", "lon"}}
+SCHOOLS_FILE = Path(__file__).with_name("schools.json")
+
+
+def _unique_school_entries(pairs: list[tuple]) -> dict:
+    """json object hook that rejects a key repeated within one object instead of keeping the last.
+
+    Runs for every object in the file, the top-level school map and each
+    nested {city, lat, lon} entry alike.
+    """
+    entries = dict(pairs)
+    if len(entries) != len(pairs):
+        seen = set()
+        dupes = set()
+        for key, _ in pairs:
+            if key in seen:
+                dupes.add(key)
+            seen.add(key)
+        raise ValueError(f"Duplicate keys in {SCHOOLS_FILE.name}: {', '.join(sorted(dupes))}")
+    return entries
+
+
+def load_schools() -> dict:
+    """Load the pre-populated Oregon school locations."""
+    with open(SCHOOLS_FILE, "rb") as f:
+        return json.load(f, object_pairs_hook=_unique_school_entries)
+
+
+OREGON_SCHOOLS = load_schools()
+
+# Column (SoA) view of OREGON_SCHOOLS: name -> row index, plus packed arrays of
+# lat/lon in radians and cos(lat), converted once at import so distance calls
+# skip the radians() conversions and the cos() of each latitude
+SCHOOL_IDX = {name: i for i, name in enumerate(OREGON_SCHOOLS)}
+SCHOOL_LAT = array("d", (radians(info["lat"]) for info in OREGON_SCHOOLS.values()))
+SCHOOL_LON = array("d", (radians(info["lon"]) for info in OREGON_SCHOOLS.values()))
+SCHOOL_COS_LAT = array("d", (cos(lat) for lat in SCHOOL_LAT))
+SCHOOL_CITY_LOWER = {name: info["city"].lower() for name, info in OREGON_SCHOOLS.items()}  # for neutral-site checks
 
+# Flat name -> (lat_rad, lon_rad, cos_lat) table. Starts with schools.json and
+# picks up co-op names and cached/geocoded schools the first time they resolve
+_COORDS = {name: (SCHOOL_LAT[i], SCHOOL_LON[i], SCHOOL_COS_LAT[i]) for name, i in SCHOOL_IDX.items()}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Game:
     """Represents a playoff game with travel distance calculation."""
     year: int
@@ -349,32 +213,134 @@ class Game:
         }
 
 
-def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate great-circle distance between two points in miles."""
-    R = 3959  # Earth's radius in miles
+EARTH_RADIUS_MI = 3959
+
+
+def haversine_pre(lat1: float, lon1: float, coslat1: float,
+                  lat2: float, lon2: float, coslat2: float) -> float:
+    """Great-circle distance in miles between two points given in radians.
+
+    cos(lat) for each point is passed in precomputed (see SCHOOL_COS_LAT).
+    """
+    # Schools in the same town often share a coordinate; along a meridian or a
+    # parallel the formula loses a term
+    if lon1 == lon2:
+        return EARTH_RADIUS_MI * abs(lat2 - lat1)
+    if lat1 == lat2:
+        return EARTH_RADIUS_MI * 2 * asin(coslat1 * abs(sin((lon2 - lon1)/2)))
+
+    a = sin((lat2 - lat1)/2)**2 + coslat1 * coslat2 * sin((lon2 - lon1)/2)**2
+    return EARTH_RADIUS_MI * 2 * asin(sqrt(a))
+
+
+def haversine_many(points1, points2) -> array:
+    """Great-circle distances in miles between two sequences of points.
+
+    Batch form of haversine_pre(): each point is a (lat_rad, lon_rad, cos_lat)
+    tuple as returned by get_school_radians(), and the math is inlined in one pass
+    that writes into a preallocated array of doubles.
+    """
+    R = EARTH_RADIUS_MI
+
+    distances = array("d", [0.0]) * len(points1)
+    _sin, _asin, _sqrt = sin, asin, sqrt
+    for k, ((lat1, lon1, coslat1), (lat2, lon2, coslat2)) in enumerate(zip(points1, points2)):
+        if lon1 == lon2:
+            distances[k] = R * abs(lat2 - lat1)
+            continue
+        if lat1 == lat2:
+            distances[k] = R * 2 * _asin(coslat1 * abs(_sin((lon2 - lon1)/2)))
+            continue
+        a = _sin((lat2 - lat1)/2)**2 + coslat1 * coslat2 * _sin((lon2 - lon1)/2)**2
+        distances[k] = R * 2 * _asin(_sqrt(a))
+    return distances
+
+
+def max_distance(p1, p2) -> float:
+    """Cheap upper bound in miles on the haversine distance between two points.
+
+    Points are (lat_rad, lon_rad, cos_lat) tuples. Walking along one point's
+    parallel and then along a meridian is never shorter than the great circle,
+    so no trig is needed to prove that a pair is close together.
+    """
+    (lat1, lon1, coslat1), (lat2, lon2, coslat2) = p1, p2
+    dlon = abs(lon2 - lon1)
+    return EARTH_RADIUS_MI * (abs(lat2 - lat1) + min(coslat1, coslat2) * min(dlon, 2 * pi - dlon))
+
+
+def ruler_distance(p1, p2) -> float:
+    """Equirectangular ("cheap ruler") upper bound in miles between two points.
+
+    Points are (lat_rad, lon_rad, cos_lat) tuples. Along the path that moves
+    latitude and longitude linearly (the short way around), every step is at
+    most hypot(dlat, c * dlon) long, where c bounds cos(lat) on the path: the
+    larger endpoint cosine when both points share a hemisphere, else 1. So
+    the result is never below the great-circle distance, for any pair, and
+    for nearby points it is usually tighter than max_distance().
+    """
+    (lat1, lon1, coslat1), (lat2, lon2, coslat2) = p1, p2
+    dlon = abs(lon2 - lon1)
+    c = max(coslat1, coslat2) if (lat1 >= 0) == (lat2 >= 0) else 1.0
+    return EARTH_RADIUS_MI * hypot(lat2 - lat1, c * min(dlon, 2 * pi - dlon))
+
+
+def _may_reach(p1, p2, miles: float) -> bool:
+    """False only when p1 and p2 are certainly less than `miles` apart.
+
+    Both max_distance() and ruler_distance() are true upper bounds anywhere
+    on the globe, so no pair at or beyond `miles` is ever dropped.
+    """
+    return max_distance(p1, p2) >= miles and ruler_distance(p1, p2) >= miles
+
 
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
+class GeocodeCache(dict):
+    """Geocoding results keyed by school name, tracking unsaved additions."""
 
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = False
 
-    return R * c
+    def add(self, school_name: str, location: dict):
+        """Record a new lookup; it is written to disk by flush()."""
+        self[school_name] = location
+        self.dirty = True
 
+    def flush(self):
+        """Save to GEOCODE_CACHE_FILE if anything was added since the last save."""
+        if self.dirty:
+            save_geocode_cache(self)
+            self.dirty = False
 
-def load_geocode_cache() -> dict:
+
+def load_geocode_cache() -> GeocodeCache:
     """Load cached geocoding results."""
     if GEOCODE_CACHE_FILE.exists():
         with open(GEOCODE_CACHE_FILE, "r") as f:
-            return json.load(f)
-    return {}
+            return GeocodeCache(json.load(f))
+    return GeocodeCache()
 
 
 def save_geocode_cache(cache: dict):
-    """Save geocoding results to cache."""
-    with open(GEOCODE_CACHE_FILE, "w") as f:
+    """Save geocoding results to cache (atomically, via a temp file)."""
+    tmp_file = GEOCODE_CACHE_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "w") as f:
         json.dump(cache, f, indent=2)
+    os.replace(tmp_file, GEOCODE_CACHE_FILE)
+
+
+_GEOCODE_CACHE: Optional[GeocodeCache] = None
+
+
+def geocode_cache() -> GeocodeCache:
+    """Get the geocoding cache, reading it from disk only on first use.
+
+    New lookups are saved once, when the interpreter exits.
+    """
+    global _GEOCODE_CACHE
+    if _GEOCODE_CACHE is None:
+        _GEOCODE_CACHE = load_geocode_cache()
+        atexit.register(_GEOCODE_CACHE.flush)
+    return _GEOCODE_CACHE
 
 
 def get_primary_school(school_name: str) -> str:
@@ -385,8 +351,12 @@ def get_primary_school(school_name: str) -> str:
     return school_name
 
 
-def get_school_location(school_name: str, cache: dict) -> Optional[dict]:
-    """Get school location from cache or Oregon schools database."""
+def get_school_location(school_name: str, cache: Optional[dict] = None) -> Optional[dict]:
+    """Get school location from cache or Oregon schools database.
+
+    With no cache given, the shared geocode_cache() is used, and it is only
+    read from disk once a school is missing from schools.json.
+    """
     # First try the exact name
     if school_name in OREGON_SCHOOLS:
         return OREGON_SCHOOLS[school_name]
@@ -396,17 +366,41 @@ def get_school_location(school_name: str, cache: dict) -> Optional[dict]:
     if primary_school != school_name and primary_school in OREGON_SCHOOLS:
         return OREGON_SCHOOLS[primary_school]
 
-    # Check pre-populated database first
-    if school_name in OREGON_SCHOOLS:
-        return OREGON_SCHOOLS[school_name]
-
     # Check cache
+    if cache is None:
+        cache = geocode_cache()
     if school_name in cache:
         return cache[school_name]
 
-    # Try to geocode (with rate limiting)
+    if not ALLOW_GEOCODE:
+        return None
+
+    # Try to geocode (with rate limiting, one scraper thread at a time)
+    with _GEOCODE_LOCK:
+        if school_name in cache:
+            return cache[school_name]
+        return _geocode_school(school_name, cache)
+
+
+def _geocode_school(school_name: str, cache: dict) -> Optional[dict]:
+    """Look up a school with Nominatim and add it to the cache.
+
+    A GeocodeCache also records the lookup as unsaved; any other dict just
+    gets the entry.
+    """
+    global _last_geocode_at
+
+    if not HAS_GEOCODER:
+        print(f"Geocoding {school_name} requires 'geopy' (pip install geopy)")
+        return None
+
+    # Rate limiting applies to live requests only, never to cache hits
+    wait = _last_geocode_at + GEOCODE_INTERVAL - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+    _last_geocode_at = time.monotonic()
+
     try:
-        from geopy.geocoders import Nominatim
         geolocator = Nominatim(user_agent="osaa_brackets_scraper")
         location = geolocator.geocode(f"{school_name} High School, Oregon, USA")
         if location:
@@ -415,9 +409,10 @@ def get_school_location(school_name: str, cache: dict) -> Optional[dict]:
                 "lat": location.latitude,
                 "lon": location.longitude,
             }
-            cache[school_name] = result
-            save_geocode_cache(cache)
-            time.sleep(1)  # Rate limiting
+            if isinstance(cache, GeocodeCache):
+                cache.add(school_name, result)
+            else:
+                cache[school_name] = result
             return result
     except Exception as e:
         print(f"Geocoding error for {school_name}: {e}")
@@ -425,32 +420,131 @@ def get_school_location(school_name: str, cache: dict) -> Optional[dict]:
     return None
 
 
-def calculate_distance(team1: str, team2: str, cache: dict) -> Optional[float]:
-    """Calculate distance between two schools."""
-    loc1 = get_school_location(team1, cache)
-    loc2 = get_school_location(team2, cache)
+def get_school_radians(school_name: str, cache: Optional[dict] = None) -> Optional[tuple[float, float, float]]:
+    """Get a school's (lat_rad, lon_rad, cos_lat), precomputed when possible.
+
+    Points from schools.json or the shared geocode_cache() are kept in _COORDS
+    for later calls; points that came from any other cache are returned
+    without being stored, so they never leak into lookups with another cache.
+    """
+    point = _COORDS.get(school_name)
+    if point is not None:
+        return point
+
+    loc = get_school_location(school_name, cache)
+    if loc:
+        lat = radians(loc["lat"])
+        point = (lat, radians(loc["lon"]), cos(lat))
+        if cache is None or cache is _GEOCODE_CACHE or get_primary_school(school_name) in OREGON_SCHOOLS:
+            _COORDS[school_name] = point
+    return point
+
+
+# Unordered pair -> miles, only for pairs whose schools both sit in _COORDS.
+# Misses are never stored, so a school that geocodes later in the run is
+# measured then instead of staying None.
+_PAIR_MILES: dict[frozenset[str], float] = {}
+
+
+def calculate_distance(team1: str, team2: str, cache: Optional[dict] = None) -> Optional[float]:
+    """Calculate distance between two schools.
+
+    Distances are memoized on the unordered pair, so a matchup that recurs
+    across rounds and years is measured once. The memo holds only pairs of
+    schools from schools.json or the shared geocode_cache(); a failed lookup,
+    or a school found only in a caller-supplied cache, is measured again on
+    every call.
+    """
+    pair = frozenset((team1, team2))
+    miles = _PAIR_MILES.get(pair)
+    if miles is None:
+        miles = _measure_distance(min(team1, team2), max(team1, team2), cache)
+        if miles is not None and team1 in _COORDS and team2 in _COORDS:
+            _PAIR_MILES[pair] = miles
+    return miles
+
+
+def _measure_distance(team1: str, team2: str, cache: Optional[dict]) -> Optional[float]:
+    loc1 = get_school_radians(team1, cache)
+    loc2 = get_school_radians(team2, cache)
 
     if loc1 and loc2:
-        return haversine(loc1["lat"], loc1["lon"], loc2["lat"], loc2["lon"])
+        return haversine_pre(*loc1, *loc2)
     return None
 
 
+def resolve_schools(teams, cache: Optional[dict] = None) -> dict[str, Optional[tuple[float, float, float]]]:
+    """Resolve every distinct team to (lat_rad, lon_rad, cos_lat) before any measuring.
+
+    Any schools geocoded along the way are saved right away, so a long run
+    that fails later doesn't have to repeat the rate-limited lookups.
+    """
+    points = {team: get_school_radians(team, cache) for team in dict.fromkeys(teams)}
+    if cache is None:
+        cache = _GEOCODE_CACHE  # still None if every team was in schools.json
+    if isinstance(cache, GeocodeCache):
+        cache.flush()
+    return points
+
+
+def calculate_distances(pairs: list[tuple[str, str]], cache: Optional[dict] = None,
+                        min_miles: float = 0) -> list[Optional[float]]:
+    """Calculate distances for many (team1, team2) pairs in one batch.
+
+    Pairs that can't be located come back as None, as do pairs that
+    _may_reach() already shows are closer than min_miles. Each team is
+    looked up and each unordered pair is measured only once per batch.
+    Without a cache, the shared geocode_cache() is read only if some team
+    is missing from schools.json.
+    """
+    keys = [(t1, t2) if t1 <= t2 else (t2, t1) for t1, t2 in pairs]
+    unique = list(dict.fromkeys(keys))
+    points = resolve_schools((t for key in unique for t in key), cache)
+
+    locations = [(points[t1], points[t2]) for t1, t2 in unique]
+    wanted = [bool(loc1 and loc2) and (not min_miles or _may_reach(loc1, loc2, min_miles))
+              for loc1, loc2 in locations]
+    known = list(compress(locations, wanted))
+
+    batch = iter(haversine_many([loc1 for loc1, _ in known], [loc2 for _, loc2 in known]))
+    by_pair = {key: next(batch) if keep else None for key, keep in zip(unique, wanted)}
+    return [by_pair[key] for key in keys]
+
+
+# Tier upper bounds (inclusive) and names; bisect_left maps a distance to its tier
+_TIER_EDGES = (TIER_GREEN, TIER_YELLOW)
+_TIER_NAMES = ("green", "yellow", "red")
+
+
 def get_tier(distance: Optional[float]) -> str:
     """Assign tier color based on distance."""
     if distance is None:
         return "unknown"
-    if distance <= TIER_GREEN:
-        return "green"
-    if distance <= TIER_YELLOW:
-        return "yellow"
-    return "red"
+    return _TIER_NAMES[bisect_left(_TIER_EDGES, distance)]
+
+
+def get_tiers(distances: list[Optional[float]]) -> list[str]:
+    """Assign tier colors to a batch of distances; same rules as get_tier()."""
+    edges, names = _TIER_EDGES, _TIER_NAMES
+    return ["unknown" if d is None else names[bisect_left(edges, d)] for d in distances]
+
+
+def _wait_for_request_slot():
+    """Block until this thread may start its next request to OSAA."""
+    global _next_request_at
+    with _request_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
 
 
 def scrape_osaa_brackets(sport: str, year: int, division: str) -> list[Game]:
     """Scrape bracket data from OSAA website."""
     if not HAS_SCRAPING:
         print("Web scraping requires 'requests' and 'beautifulsoup4' packages.")
-        print("Install with: pip install requests beautifulsoup4")
+        print("Install with: pip install requests beautifulsoup4 (plus lxml for faster parsing)")
         return []
 
     games = []
@@ -464,20 +558,18 @@ def scrape_osaa_brackets(sport: str, year: int, division: str) -> list[Game]:
     url = f"{OSAA_BASE_URL}/activities/{sport_info['code']}/brackets/{year}/{div_url}"
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; OSAA Brackets Scraper/1.0)"
-        }
-        response = requests.get(url, headers=headers, timeout=30)
+        _wait_for_request_slot()
+        response = SESSION.get(url, timeout=30)
 
         if response.status_code != 200:
             print(f"Failed to fetch {url}: {response.status_code}")
             return games
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, HTML_PARSER)
 
         # Parse bracket games - structure varies by sport
         # Look for game containers
-        game_elements = soup.find_all(class_=re.compile(r"game|matchup|bracket-game"))
+        game_elements = soup.select(_SEL_GAME)
 
         for game_el in game_elements:
             try:
@@ -489,7 +581,7 @@ def scrape_osaa_brackets(sport: str, year: int, division: str) -> list[Game]:
                 continue
 
         # Also try table-based layouts
-        tables = soup.find_all("table", class_=re.compile(r"bracket|schedule|playoff"))
+        tables = soup.select(_SEL_TABLE)
         for table in tables:
             rows = table.find_all("tr")
             for row in rows:
@@ -500,8 +592,6 @@ def scrape_osaa_brackets(sport: str, year: int, division: str) -> list[Game]:
                 except Exception as e:
                     continue
 
-        time.sleep(0.5)  # Rate limiting
-
     except Exception as e:
         print(f"Error scraping {url}: {e}")
 
@@ -510,10 +600,10 @@ def scrape_osaa_brackets(sport: str, year: int, division: str) -> list[Game]:
 
 def parse_game_element(element, year: int, sport: str, division: str) -> Optional[Game]:
     """Parse a game element from bracket HTML."""
-    geocode_cache = load_geocode_cache()
+    cache = geocode_cache()
 
     # Extract team names
-    team_elements = element.find_all(class_=re.compile(r"team|school|participant"))
+    team_elements = element.select(_SEL_TEAM)
     if len(team_elements) < 2:
         return None
 
@@ -525,22 +615,22 @@ def parse_game_element(element, year: int, sport: str, division: str) -> Optiona
     team2, seed2 = parse_team_seed(team2_text)
 
     # Extract score if available
-    score_el = element.find(class_=re.compile(r"score|result"))
+    score_el = element.select_one(_SEL_SCORE)
     score = score_el.get_text(strip=True) if score_el else None
 
     # Extract round name
-    round_el = element.find(class_=re.compile(r"round|stage"))
+    round_el = element.select_one(_SEL_ROUND)
     round_name = round_el.get_text(strip=True) if round_el else "Unknown Round"
 
     # Extract location
-    location_el = element.find(class_=re.compile(r"location|venue|site"))
-    location = location_el.get_text(strip=True) if location_el else ""
+    location_el = element.select_one(_SEL_LOC)
+    location = sys.intern(location_el.get_text(strip=True)) if location_el else ""
 
     # Determine if neutral site (location doesn't match either team's home)
     is_neutral = determine_neutral_site(location, team1, team2)
 
     # Calculate distance
-    distance = calculate_distance(team1, team2, geocode_cache)
+    distance = calculate_distance(team1, team2, cache)
     tier = get_tier(distance)
 
     return Game(
@@ -562,7 +652,7 @@ def parse_game_element(element, year: int, sport: str, division: str) -> Optiona
 
 def parse_table_row(row, year: int, sport: str, division: str) -> Optional[Game]:
     """Parse a game from a table row."""
-    geocode_cache = load_geocode_cache()
+    cache = geocode_cache()
 
     cells = row.find_all(["td", "th"])
     if len(cells) < 2:
@@ -579,9 +669,9 @@ def parse_table_row(row, year: int, sport: str, division: str) -> Optional[Game]
 
     for text in text_content:
         if " vs " in text.lower() or " v " in text.lower():
-            parts = re.split(r"\s+(?:vs?\.?|@)\s+", text, flags=re.IGNORECASE)
+            parts = _RE_VS.split(text)
             teams.extend([p.strip() for p in parts if p.strip()])
-        elif re.match(r"^\d+-\d+$", text):
+        elif _RE_SCORE.match(text):
             score = text
         elif "round" in text.lower() or "final" in text.lower():
             round_name = text
@@ -589,7 +679,7 @@ def parse_table_row(row, year: int, sport: str, division: str) -> Optional[Game]
     if len(teams) < 2:
         # Try individual cells as team names
         for text in text_content:
-            if len(text) > 2 and not re.match(r"^\d+$", text):
+            if len(text) > 2 and not _RE_DIGITS.match(text):
                 teams.append(text)
 
     if len(teams) < 2:
@@ -599,7 +689,7 @@ def parse_table_row(row, year: int, sport: str, division: str) -> Optional[Game]
     team2, seed2 = parse_team_seed(teams[1])
 
     is_neutral = determine_neutral_site(location, team1, team2)
-    distance = calculate_distance(team1, team2, geocode_cache)
+    distance = calculate_distance(team1, team2, cache)
     tier = get_tier(distance)
 
     return Game(
@@ -620,18 +710,28 @@ def parse_table_row(row, year: int, sport: str, division: str) -> Optional[Game]
 
 
 def parse_team_seed(text: str) -> tuple[str, Optional[int]]:
-    """Parse team name and seed from text like '#1 Lincoln' or '(1) Lincoln'."""
+    """Parse team name and seed from text like '#1 Lincoln' or '(1) Lincoln'.
+
+    Team names are interned: a few hundred schools recur across thousands of
+    games, and interned keys make the school and distance lookups cheaper.
+    """
+    text = text.strip()
+
     # Match patterns like "#1", "(1)", "1.", etc. at start
-    match = re.match(r"^[#(\[]?(\d+)[)\].]?\s*(.+)$", text.strip())
-    if match:
-        return match.group(2).strip(), int(match.group(1))
+    first = text[:1]
+    if first and (first in "#([" or first.isdigit()):
+        match = _RE_SEED_PREFIX.match(text)
+        if match:
+            return sys.intern(match.group(2).strip()), int(match.group(1))
 
     # Match pattern at end like "Lincoln (1)"
-    match = re.match(r"^(.+?)\s*[#(\[]?(\d+)[)\]]?$", text.strip())
-    if match:
-        return match.group(1).strip(), int(match.group(2))
+    last = text[-1:]
+    if last and (last in ")]" or last.isdigit()):
+        match = _RE_SEED_SUFFIX.match(text)
+        if match:
+            return sys.intern(match.group(1).strip()), int(match.group(2))
 
-    return text.strip(), None
+    return sys.intern(text), None
 
 
 def determine_neutral_site(location: str, team1: str, team2: str) -> bool:
@@ -641,135 +741,142 @@ def determine_neutral_site(location: str, team1: str, team2: str) -> bool:
 
     location_lower = location.lower()
 
-    # Common neutral site indicators
-    neutral_keywords = [
-        "university", "college", "civic", "stadium", "state",
-        "volcanoes", "pk park", "jane sanders", "hillsboro hops"
-    ]
-
-    for keyword in neutral_keywords:
-        if keyword in location_lower:
-            return True
+    if _NEUTRAL_RE.search(location_lower):
+        return True
 
     # Check if location matches either team's home city
-    for team in [team1, team2]:
+    for team in (team1, team2):
         if team.lower() in location_lower:
             return False
-        school_info = OREGON_SCHOOLS.get(team)
-        if school_info and school_info["city"].lower() in location_lower:
+        city_lower = SCHOOL_CITY_LOWER.get(team)
+        if city_lower is not None and city_lower in location_lower:
             return False
 
     return True
 
 
-def scrape_all_brackets() -> list[Game]:
+def scrape_all_brackets(workers: int = SCRAPE_WORKERS) -> list[Game]:
     """Scrape all brackets for all sports, years, and divisions."""
     all_games = []
+    tasks = [(sport, year, division)
+             for sport in SPORTS for year in YEARS for division in DIVISIONS[sport]]
 
-    for sport in SPORTS:
-        for year in YEARS:
-            for division in DIVISIONS[sport]:
-                print(f"Scraping {sport} {division} {year}...")
-                games = scrape_osaa_brackets(sport, year, division)
-                all_games.extend(games)
-                print(f"  Found {len(games)} games")
+    # Requests are latency-bound, so overlap them; map() keeps results in task order
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tasks)))) as executor:
+        results = executor.map(lambda task: scrape_osaa_brackets(*task), tasks)
+        for (sport, year, division), games in zip(tasks, results):
+            all_games.extend(games)
+            print(f"Scraped {sport} {division} {year}: {len(games)} games")
 
     return all_games
 
 
+# Sample long-haul matchups (95+ miles) for baseball/softball 2022-2025
+SAMPLE_MATCHUPS = (
+    # 2025 Baseball
+    (2025, "baseball", "6A", "First Round", "Jesuit", 1, "South Medford", 16),
+    (2025, "baseball", "6A", "Quarterfinals", "Sheldon", 4, "Clackamas", 5),
+    (2025, "baseball", "5A", "First Round", "Summit", 1, "Pendleton", 16),
+    (2025, "baseball", "5A", "First Round", "Crescent Valley", 2, "Pendleton", 15),
+    (2025, "baseball", "5A", "Quarterfinals", "La Salle Prep", 3, "Redmond", 14),
+    (2025, "baseball", "4A", "First Round", "Marist Catholic", 1, "Ontario", 16),
+    (2025, "baseball", "4A", "First Round", "Hidden Valley", 2, "La Grande", 15),
+    (2025, "baseball", "3A", "First Round", "Rainier", 1, "Enterprise", 16),
+    (2025, "baseball", "2A/1A", "First Round", "Kennedy", 1, "Nyssa", 16),
+
+    # 2025 Softball
+    (2025, "softball", "6A", "First Round", "Sunset", 1, "Roseburg", 16),
+    (2025, "softball", "6A", "Quarterfinals", "Clackamas", 4, "Grants Pass", 5),
+    (2025, "softball", "5A", "First Round", "Wilsonville", 1, "Ashland", 16),
+    (2025, "softball", "5A", "First Round", "Churchill", 2, "Pendleton", 15),
+    (2025, "softball", "4A", "First Round", "Valley Catholic", 1, "Klamath Union", 16),
+
+    # 2024 Baseball
+    (2024, "baseball", "6A", "First Round", "Lincoln", 1, "Crater", 16),
+    (2024, "baseball", "6A", "Quarterfinals", "Tualatin", 3, "South Medford", 6),
+    (2024, "baseball", "5A", "First Round", "Crescent Valley", 1, "Pendleton", 16),
+    (2024, "baseball", "5A", "First Round", "La Salle Prep", 2, "Redmond", 15),
+    (2024, "baseball", "5A", "Quarterfinals", "Churchill", 3, "Bend", 6),
+    (2024, "baseball", "4A", "First Round", "Marist Catholic", 1, "Baker", 16),
+    (2024, "baseball", "4A", "First Round", "Philomath", 2, "Ontario", 15),
+    (2024, "baseball", "3A", "First Round", "Cascade Christian", 1, "Enterprise", 16),
+    (2024, "baseball", "2A/1A", "First Round", "Gaston", 1, "Nyssa", 16),
+
+    # 2024 Softball
+    (2024, "softball", "6A", "First Round", "Sheldon", 1, "Grants Pass", 16),
+    (2024, "softball", "6A", "Quarterfinals", "Jesuit", 3, "Roseburg", 6),
+    (2024, "softball", "5A", "First Round", "Summit", 1, "Pendleton", 16),
+    (2024, "softball", "5A", "Quarterfinals", "Crescent Valley", 4, "Pendleton", 5),
+    (2024, "softball", "4A", "First Round", "Valley Catholic", 1, "Klamath Union", 16),
+
+    # 2023 Baseball
+    (2023, "baseball", "6A", "First Round", "Clackamas", 1, "South Medford", 16),
+    (2023, "baseball", "6A", "Quarterfinals", "Jesuit", 4, "Crater", 5),
+    (2023, "baseball", "5A", "First Round", "Churchill", 1, "Pendleton", 16),
+    (2023, "baseball", "5A", "First Round", "Summit", 2, "Pendleton", 15),
+    (2023, "baseball", "5A", "Quarterfinals", "Crescent Valley", 3, "Redmond", 6),
+    (2023, "baseball", "4A", "First Round", "Philomath", 1, "Ontario", 16),
+    (2023, "baseball", "4A", "First Round", "Marist Catholic", 2, "Baker", 15),
+    (2023, "baseball", "3A", "First Round", "Dayton", 1, "La Grande", 16),
+    (2023, "baseball", "2A/1A", "First Round", "Vernonia", 1, "Nyssa", 16),
+
+    # 2023 Softball
+    (2023, "softball", "6A", "First Round", "Sunset", 1, "South Medford", 16),
+    (2023, "softball", "6A", "Quarterfinals", "West Linn", 4, "Grants Pass", 5),
+    (2023, "softball", "5A", "First Round", "Crescent Valley", 1, "Pendleton", 16),
+    (2023, "softball", "5A", "First Round", "Churchill", 2, "Redmond", 15),
+    (2023, "softball", "4A", "First Round", "Marist Catholic", 1, "Klamath Union", 16),
+
+    # 2022 Baseball
+    (2022, "baseball", "6A", "First Round", "Tualatin", 1, "Crater", 16),
+    (2022, "baseball", "6A", "Quarterfinals", "Clackamas", 3, "South Medford", 6),
+    (2022, "baseball", "5A", "First Round", "Crescent Valley", 1, "Pendleton", 16),
+    (2022, "baseball", "5A", "First Round", "Summit", 2, "Pendleton", 15),
+    (2022, "baseball", "5A", "Quarterfinals", "Churchill", 4, "Redmond", 5),
+    (2022, "baseball", "4A", "First Round", "Philomath", 1, "Baker", 16),
+    (2022, "baseball", "4A", "First Round", "Marist Catholic", 2, "Ontario", 15),
+    (2022, "baseball", "3A", "First Round", "Rainier", 1, "Enterprise", 16),
+    (2022, "baseball", "2A/1A", "First Round", "Kennedy", 1, "Nyssa", 16),
+
+    # 2022 Softball
+    (2022, "softball", "6A", "First Round", "Jesuit", 1, "Roseburg", 16),
+    (2022, "softball", "6A", "Quarterfinals", "Sheldon", 3, "South Medford", 6),
+    (2022, "softball", "5A", "First Round", "Summit", 1, "Pendleton", 16),
+    (2022, "softball", "5A", "First Round", "Crescent Valley", 2, "Pendleton", 15),
+    (2022, "softball", "4A", "First Round", "Valley Catholic", 1, "Klamath Union", 16),
+)
+
+# Column-wise view of SAMPLE_MATCHUPS, so distances and filtering work per column
+(SAMPLE_YEARS, SAMPLE_SPORTS, SAMPLE_DIVISIONS, SAMPLE_ROUNDS,
+ SAMPLE_TEAM1, SAMPLE_SEED1, SAMPLE_TEAM2, SAMPLE_SEED2) = zip(*SAMPLE_MATCHUPS)
+
+
+@lru_cache(maxsize=None)
+def sample_distances() -> tuple[Optional[float], ...]:
+    """Distances for SAMPLE_MATCHUPS (None below the threshold), computed once per process."""
+    return tuple(calculate_distances(
+        list(zip(SAMPLE_TEAM1, SAMPLE_TEAM2)), min_miles=MIN_DISTANCE_THRESHOLD,
+    ))
+
+
 def generate_sample_data() -> list[Game]:
     """Generate sample data for testing/demo purposes - only baseball/softball matchups over 95 miles."""
-    geocode_cache = load_geocode_cache()
     games = []
+    distances = sample_distances()
 
-    # Sample long-haul matchups (95+ miles) for baseball/softball 2022-2025
-    sample_matchups = [
-        # 2025 Baseball
-        (2025, "baseball", "6A", "First Round", "Jesuit", 1, "South Medford", 16),
-        (2025, "baseball", "6A", "Quarterfinals", "Sheldon", 4, "Clackamas", 5),
-        (2025, "baseball", "5A", "First Round", "Summit", 1, "Pendleton", 16),
-        (2025, "baseball", "5A", "First Round", "Crescent Valley", 2, "Pendleton", 15),
-        (2025, "baseball", "5A", "Quarterfinals", "La Salle Prep", 3, "Redmond", 14),
-        (2025, "baseball", "4A", "First Round", "Marist Catholic", 1, "Ontario", 16),
-        (2025, "baseball", "4A", "First Round", "Hidden Valley", 2, "La Grande", 15),
-        (2025, "baseball", "3A", "First Round", "Rainier", 1, "Enterprise", 16),
-        (2025, "baseball", "2A/1A", "First Round", "Kennedy", 1, "Nyssa", 16),
-
-        # 2025 Softball
-        (2025, "softball", "6A", "First Round", "Sunset", 1, "Roseburg", 16),
-        (2025, "softball", "6A", "Quarterfinals", "Clackamas", 4, "Grants Pass", 5),
-        (2025, "softball", "5A", "First Round", "Wilsonville", 1, "Ashland", 16),
-        (2025, "softball", "5A", "First Round", "Churchill", 2, "Pendleton", 15),
-        (2025, "softball", "4A", "First Round", "Valley Catholic", 1, "Klamath Union", 16),
-
-        # 2024 Baseball
-        (2024, "baseball", "6A", "First Round", "Lincoln", 1, "Crater", 16),
-        (2024, "baseball", "6A", "Quarterfinals", "Tualatin", 3, "South Medford", 6),
-        (2024, "baseball", "5A", "First Round", "Crescent Valley", 1, "Pendleton", 16),
-        (2024, "baseball", "5A", "First Round", "La Salle Prep", 2, "Redmond", 15),
-        (2024, "baseball", "5A", "Quarterfinals", "Churchill", 3, "Bend", 6),
-        (2024, "baseball", "4A", "First Round", "Marist Catholic", 1, "Baker", 16),
-        (2024, "baseball", "4A", "First Round", "Philomath", 2, "Ontario", 15),
-        (2024, "baseball", "3A", "First Round", "Cascade Christian", 1, "Enterprise", 16),
-        (2024, "baseball", "2A/1A", "First Round", "Gaston", 1, "Nyssa", 16),
-
-        # 2024 Softball
-        (2024, "softball", "6A", "First Round", "Sheldon", 1, "Grants Pass", 16),
-        (2024, "softball", "6A", "Quarterfinals", "Jesuit", 3, "Roseburg", 6),
-        (2024, "softball", "5A", "First Round", "Summit", 1, "Pendleton", 16),
-        (2024, "softball", "5A", "Quarterfinals", "Crescent Valley", 4, "Pendleton", 5),
-        (2024, "softball", "4A", "First Round", "Valley Catholic", 1, "Klamath Union", 16),
-
-        # 2023 Baseball
-        (2023, "baseball", "6A", "First Round", "Clackamas", 1, "South Medford", 16),
-        (2023, "baseball", "6A", "Quarterfinals", "Jesuit", 4, "Crater", 5),
-        (2023, "baseball", "5A", "First Round", "Churchill", 1, "Pendleton", 16),
-        (2023, "baseball", "5A", "First Round", "Summit", 2, "Pendleton", 15),
-        (2023, "baseball", "5A", "Quarterfinals", "Crescent Valley", 3, "Redmond", 6),
-        (2023, "baseball", "4A", "First Round", "Philomath", 1, "Ontario", 16),
-        (2023, "baseball", "4A", "First Round", "Marist Catholic", 2, "Baker", 15),
-        (2023, "baseball", "3A", "First Round", "Dayton", 1, "La Grande", 16),
-        (2023, "baseball", "2A/1A", "First Round", "Vernonia", 1, "Nyssa", 16),
-
-        # 2023 Softball
-        (2023, "softball", "6A", "First Round", "Sunset", 1, "South Medford", 16),
-        (2023, "softball", "6A", "Quarterfinals", "West Linn", 4, "Grants Pass", 5),
-        (2023, "softball", "5A", "First Round", "Crescent Valley", 1, "Pendleton", 16),
-        (2023, "softball", "5A", "First Round", "Churchill", 2, "Redmond", 15),
-        (2023, "softball", "4A", "First Round", "Marist Catholic", 1, "Klamath Union", 16),
-
-        # 2022 Baseball
-        (2022, "baseball", "6A", "First Round", "Tualatin", 1, "Crater", 16),
-        (2022, "baseball", "6A", "Quarterfinals", "Clackamas", 3, "South Medford", 6),
-        (2022, "baseball", "5A", "First Round", "Crescent Valley", 1, "Pendleton", 16),
-        (2022, "baseball", "5A", "First Round", "Summit", 2, "Pendleton", 15),
-        (2022, "baseball", "5A", "Quarterfinals", "Churchill", 4, "Redmond", 5),
-        (2022, "baseball", "4A", "First Round", "Philomath", 1, "Baker", 16),
-        (2022, "baseball", "4A", "First Round", "Marist Catholic", 2, "Ontario", 15),
-        (2022, "baseball", "3A", "First Round", "Rainier", 1, "Enterprise", 16),
-        (2022, "baseball", "2A/1A", "First Round", "Kennedy", 1, "Nyssa", 16),
-
-        # 2022 Softball
-        (2022, "softball", "6A", "First Round", "Jesuit", 1, "Roseburg", 16),
-        (2022, "softball", "6A", "Quarterfinals", "Sheldon", 3, "South Medford", 6),
-        (2022, "softball", "5A", "First Round", "Summit", 1, "Pendleton", 16),
-        (2022, "softball", "5A", "First Round", "Crescent Valley", 2, "Pendleton", 15),
-        (2022, "softball", "4A", "First Round", "Valley Catholic", 1, "Klamath Union", 16),
-    ]
-
-    for year, sport, division, round_name, team1, seed1, team2, seed2 in sample_matchups:
-        distance = calculate_distance(team1, team2, geocode_cache)
-
-        # Only include matchups over 95 miles
-        if distance is None or distance < MIN_DISTANCE_THRESHOLD:
-            continue
-
-        tier = get_tier(distance)
+    # Only include matchups over 95 miles; Games are built for these rows only
+    kept = [k for k, distance in enumerate(distances)
+            if distance is not None and distance >= MIN_DISTANCE_THRESHOLD]
+    tiers = get_tiers([distances[k] for k in kept])
 
+    for k, tier in zip(kept, tiers):
+        team1, seed1 = SAMPLE_TEAM1[k], SAMPLE_SEED1[k]
+        team2, seed2 = SAMPLE_TEAM2[k], SAMPLE_SEED2[k]
+        round_name = SAMPLE_ROUNDS[k]
         games.append(Game(
-            year=year,
-            sport=sport,
-            division=division,
+            year=SAMPLE_YEARS[k],
+            sport=SAMPLE_SPORTS[k],
+            division=SAMPLE_DIVISIONS[k],
             round_name=round_name,
             team1=team1,
             team1_seed=seed1,
@@ -778,7 +885,7 @@ def generate_sample_data() -> list[Game]:
             score=None,
             location=f"{team1} HS" if seed1 < seed2 else f"{team2} HS",
             is_neutral_site=round_name == "Championship",
-            distance_miles=distance,
+            distance_miles=distances[k],
             tier=tier,
         ))
 
@@ -787,33 +894,39 @@ def generate_sample_data() -> list[Game]:
 
 def load_from_json(filename: str = "bracket_data.json") -> list[Game]:
     """Load matchup data from JSON file and calculate distances."""
-    geocode_cache = load_geocode_cache()
     games = []
 
     try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-
-        for matchup in data.get("matchups", []):
-            team1 = matchup.get("team1", "")
-            team2 = matchup.get("team2", "")
-
-            distance = calculate_distance(team1, team2, geocode_cache)
-
-            # Only include matchups over minimum threshold
-            if distance is None or distance < MIN_DISTANCE_THRESHOLD:
-                continue
-
-            tier = get_tier(distance)
-
+        if HAS_ORJSON:
+            with open(filename, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filename, "r") as f:
+                data = json.load(f)
+
+        # Rows missing a team can never be measured; drop them before any lookups
+        matchups = [m for m in data.get("matchups", []) if m.get("team1") and m.get("team2")]
+        distances = calculate_distances(
+            [(m["team1"], m["team2"]) for m in matchups],
+            min_miles=MIN_DISTANCE_THRESHOLD,
+        )
+
+        # Only include matchups over minimum threshold
+        kept = [
+            (matchup, distance) for matchup, distance in zip(matchups, distances)
+            if distance is not None and distance >= MIN_DISTANCE_THRESHOLD
+        ]
+        tiers = get_tiers([distance for _, distance in kept])
+
+        for (matchup, distance), tier in zip(kept, tiers):
             games.append(Game(
                 year=matchup.get("year", 0),
                 sport=matchup.get("sport", ""),
                 division=matchup.get("division", ""),
                 round_name=matchup.get("round", ""),
-                team1=team1,
+                team1=matchup["team1"],
                 team1_seed=matchup.get("team1_seed"),
-                team2=team2,
+                team2=matchup["team2"],
                 team2_seed=matchup.get("team2_seed"),
                 score=matchup.get("score"),
                 location=matchup.get("location", ""),
@@ -832,27 +945,23 @@ def load_from_json(filename: str = "bracket_data.json") -> list[Game]:
     return games
 
 
-def export_to_csv(games: list[Game], filename: str = "osaa_brackets.csv"):
-    """Export games to CSV file."""
-    if not games:
+def export_to_csv(rows: list[dict], filename: str = "osaa_brackets.csv"):
+    """Export games (as Game.to_dict() rows) to CSV file."""
+    if not rows:
         return
 
-    with open(filename, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=games[0].to_dict().keys())
-        writer.writeheader()
-        for game in games:
-            writer.writerow(game.to_dict())
-
-    print(f"Exported {len(games)} games to {filename}")
+    # Every row comes from Game.to_dict(), so all share one key order and
+    # plain positional rows can skip DictWriter's per-row key checks
+    with open(filename, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(rows[0].keys())
+        writer.writerows(map(dict.values, rows))
 
+    print(f"Exported {len(rows)} games to {filename}")
 
-def generate_html(games: list[Game], output_file: str = "brackets.html"):
-    """Generate static HTML file with interactive table."""
 
-    # Convert games to JSON for JavaScript
-    games_json = json.dumps([g.to_dict() for g in games])
-
-    html_template = '''<!DOCTYPE html>
+# Page template for generate_html(); the games JSON goes where __GAMES_JSON__ is
+_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1016,6 +1125,17 @@ def generate_html(games: list[Game], output_file: str = "brackets.html"):
         tr:hover {
             background: #f7fafc;
         }
+        .games-scroll {
+            max-height: 75vh;
+            overflow-y: auto;
+        }
+        #games-table td {
+            white-space: nowrap;
+        }
+        #games-table .spacer td {
+            padding: 0;
+            border: 0;
+        }
         .tier-green { background-color: #c6f6d5; }
         .tier-yellow { background-color: #fefcbf; }
         .tier-red { background-color: #fed7d7; }
@@ -1341,6 +1461,7 @@ def generate_html(games: list[Game], output_file: str = "brackets.html"):
 
         <div class="table-container">
             <h2 style="margin: 0 0 1rem 0; color: #1a365d;">📋 All Long-Haul Matchups</h2>
+            <div id="games-scroll" class="games-scroll">
             <table id="games-table">
                 <thead>
                     <tr>
@@ -1357,6 +1478,7 @@ def generate_html(games: list[Game], output_file: str = "brackets.html"):
                 <tbody id="games-body">
                 </tbody>
             </table>
+            </div>
         </div>
 
         <footer>
@@ -1364,86 +1486,170 @@ def generate_html(games: list[Game], output_file: str = "brackets.html"):
         </footer>
     </div>
 
+    <script id="games-data" type="application/json">__GAMES_JSON__</script>
     <script>
-        const allGames = ''' + games_json + ''';
+        // JSON.parse on a data island is cheaper than parsing a JS array literal.
+        // The island holds either the games array or the URL of a games.<hash>.json file
+        const gamesData = JSON.parse(document.getElementById('games-data').textContent);
+        let allGames = Array.isArray(gamesData) ? gamesData : [];
+
+        // Nodes touched on every filter, sort or scroll, looked up once
+        const els = {
+            sportFilter: document.getElementById('sport-filter'),
+            yearFilter: document.getElementById('year-filter'),
+            divisionFilter: document.getElementById('division-filter'),
+            tierFilter: document.getElementById('tier-filter'),
+            roundFilter: document.getElementById('round-filter'),
+            totalGames: document.getElementById('total-games'),
+            avgDistance: document.getElementById('avg-distance'),
+            greenPct: document.getElementById('green-pct'),
+            redPct: document.getElementById('red-pct'),
+            scroll: document.getElementById('games-scroll'),
+            tbody: document.getElementById('games-body'),
+            ths: Array.from(document.querySelectorAll('th[data-sort]')),
+        };
 
         let filteredGames = [...allGames];
+        let matchingGames = filteredGames;
+        let matchingIdx = null;  // positions in allGames of matchingGames; null when unfiltered
+        let filterKey = '';
         let sortColumn = 'year';
         let sortDirection = 'desc';
 
+        // Sorted results keyed by filters + sort order, so flipping back to a
+        // previous sort is a lookup. Oldest entry is evicted past the limit.
+        const SORT_CACHE_SIZE = 32;
+        const sortCache = new Map();
+
+        // Sort keys for the current filters and column, in data order; a
+        // direction flip re-sorts these without rebuilding them
+        let keyedGames = [];
+        let keyedFor = null;
+
+        // Inverted index per filter field: value -> ascending positions in allGames
+        const FILTER_FIELDS = ['sport', 'year', 'division', 'tier', 'round'];
+        const NO_GAMES = new Int32Array(0);
+        let filterIndex = null;
+
+        function buildFilterIndex() {
+            filterIndex = {};
+            for (const field of FILTER_FIELDS) {
+                const byValue = new Map();
+                allGames.forEach((game, i) => {
+                    const list = byValue.get(game[field]);
+                    if (list) list.push(i);
+                    else byValue.set(game[field], [i]);
+                });
+                for (const [value, list] of byValue) byValue.set(value, Int32Array.from(list));
+                filterIndex[field] = byValue;
+            }
+        }
+
+        function indexFor(field, value) {
+            return filterIndex[field].get(value) || NO_GAMES;
+        }
+
+        // Linear merge of two ascending index lists
+        function intersect(a, b) {
+            const out = new Int32Array(Math.min(a.length, b.length));
+            let i = 0, j = 0, n = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] < b[j]) i++;
+                else if (a[i] > b[j]) j++;
+                else { out[n++] = a[i]; i++; j++; }
+            }
+            return out.subarray(0, n);
+        }
+
         function filterGames() {
-            const sport = document.getElementById('sport-filter').value;
-            const year = document.getElementById('year-filter').value;
-            const division = document.getElementById('division-filter').value;
-            const tier = document.getElementById('tier-filter').value;
-            const round = document.getElementById('round-filter').value;
-
-            filteredGames = allGames.filter(game => {
-                if (sport && game.sport !== sport) return false;
-                if (year && game.year !== parseInt(year)) return false;
-                if (division && game.division !== division) return false;
-                if (tier && game.tier !== tier) return false;
-                if (round && game.round !== round) return false;
-                return true;
-            });
+            const sport = els.sportFilter.value;
+            const year = els.yearFilter.value;
+            const division = els.divisionFilter.value;
+            const tier = els.tierFilter.value;
+            const round = els.roundFilter.value;
+
+            const previousKey = filterKey;
+            filterKey = [sport, year, division, tier, round].join('|');
+            if (!sport && !year && !division && !tier && !round) {
+                // Nothing selected: every game matches. Sorting works on a
+                // copy, so allGames itself is never reordered
+                matchingGames = allGames;
+                matchingIdx = null;
+            } else {
+                if (!filterIndex) buildFilterIndex();
+                const lists = [];
+                if (sport) lists.push(indexFor('sport', sport));
+                if (year) lists.push(indexFor('year', parseInt(year)));
+                if (division) lists.push(indexFor('division', division));
+                if (tier) lists.push(indexFor('tier', tier));
+                if (round) lists.push(indexFor('round', round));
+                lists.sort((a, b) => a.length - b.length);
+                matchingIdx = lists.reduce(intersect);
+                matchingGames = Array.from(matchingIdx, i => allGames[i]);
+            }
 
             sortGames();
-            renderTable();
+            // A new result set starts at the top; re-sorting keeps the scroll position
+            renderTable(filterKey !== previousKey);
             updateStats();
         }
 
         function sortGames() {
-            filteredGames.sort((a, b) => {
-                let aVal = a[sortColumn];
-                let bVal = b[sortColumn];
-
-                if (aVal === null || aVal === undefined) aVal = '';
-                if (bVal === null || bVal === undefined) bVal = '';
-
-                if (typeof aVal === 'number' && typeof bVal === 'number') {
-                    return sortDirection === 'asc' ? aVal - bVal : bVal - aVal;
+            const key = filterKey + '|' + sortColumn + '|' + sortDirection;
+            let sorted = sortCache.get(key);
+            if (sorted) {
+                sortCache.delete(key);
+            } else {
+                const keyedKey = filterKey + '|' + sortColumn;
+                if (keyedFor !== keyedKey) {
+                    keyedGames = matchingGames.map(sortKey);
+                    keyedFor = keyedKey;
+                }
+                const compare = sortDirection === 'asc' ? compareKeys : (a, b) => compareKeys(b, a);
+                sorted = keyedGames.slice().sort(compare).map(k => k[2]);
+                if (sortCache.size >= SORT_CACHE_SIZE) {
+                    sortCache.delete(sortCache.keys().next().value);
                 }
+            }
+            sortCache.set(key, sorted);
+            filteredGames = sorted;
+        }
 
-                aVal = String(aVal).toLowerCase();
-                bVal = String(bVal).toLowerCase();
+        // Case-insensitive, and digit runs compare by value ("Round 2" < "Round 10")
+        const COLLATOR = new Intl.Collator(undefined, { numeric: true, sensitivity: 'base' });
 
-                if (aVal < bVal) return sortDirection === 'asc' ? -1 : 1;
-                if (aVal > bVal) return sortDirection === 'asc' ? 1 : -1;
-                return 0;
-            });
+        // Decorate each game with its sort value and text once, so the
+        // comparator never allocates strings
+        function sortKey(game) {
+            let value = game[sortColumn];
+            if (value === null || value === undefined) value = '';
+            return [value, String(value), game];
         }
 
-        function renderTable() {
-            const tbody = document.getElementById('games-body');
+        function compareKeys(a, b) {
+            if (typeof a[0] === 'number' && typeof b[0] === 'number') {
+                return a[0] - b[0];
+            }
+            return COLLATOR.compare(a[1], b[1]);
+        }
+
+        // Only rows near the visible part of the scroll box are in the DOM; spacer
+        // rows stand in for the rest so the scrollbar still covers the full list
+        const ROW_OVERSCAN = 10;
+        let rowHeight = 0;  // measured from the first rendered row
+
+        function renderTable(resetScroll = false) {
+            if (resetScroll) els.scroll.scrollTop = 0;
 
             if (filteredGames.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="8" class="no-data">No games match the selected filters</td></tr>';
+                els.tbody.innerHTML = '<tr><td colspan="8" class="no-data">No games match the selected filters</td></tr>';
                 return;
             }
 
-            tbody.innerHTML = filteredGames.map(game => {
-                const tierClass = 'tier-' + (game.tier || 'unknown');
-                const neutralBadge = game.neutral_site ? '<span class="neutral-badge">NEUTRAL</span>' : '';
-                const seed1 = game.team1_seed ? `<span class="seed">#${game.team1_seed}</span> ` : '';
-                const seed2 = game.team2_seed ? `<span class="seed">#${game.team2_seed}</span> ` : '';
-                const distance = game.distance_miles !== null ? game.distance_miles + ' mi' : 'N/A';
-
-                return `
-                    <tr class="${tierClass}">
-                        <td>${game.year}</td>
-                        <td>${capitalize(game.sport)}</td>
-                        <td>${game.division}</td>
-                        <td>${game.round}</td>
-                        <td>${seed1}${game.team1}</td>
-                        <td>${seed2}${game.team2}</td>
-                        <td>${distance}</td>
-                        <td>${game.location}${neutralBadge}</td>
-                    </tr>
-                `;
-            }).join('');
+            renderRows();
 
             // Update sort indicators
-            document.querySelectorAll('th').forEach(th => {
+            els.ths.forEach(th => {
                 th.classList.remove('sort-asc', 'sort-desc');
                 if (th.dataset.sort === sortColumn) {
                     th.classList.add(sortDirection === 'asc' ? 'sort-asc' : 'sort-desc');
@@ -1451,26 +1657,144 @@ def generate_html(games: list[Game], output_file: str = "brackets.html"):
             });
         }
 
+        function renderRows() {
+            const tbody = els.tbody;
+            const viewport = els.scroll;
+            const total = filteredGames.length;
+            const height = rowHeight || 40;
+            const start = Math.min(total, Math.max(0, Math.floor(viewport.scrollTop / height) - ROW_OVERSCAN));
+            const end = Math.min(total, Math.ceil((viewport.scrollTop + viewport.clientHeight) / height) + ROW_OVERSCAN);
+
+            // Build rows off-document and swap them in with a single DOM mutation
+            const frag = document.createDocumentFragment();
+            if (start > 0) frag.appendChild(spacerRow(start * height));
+            for (let i = start; i < end; i++) {
+                frag.appendChild(gameRow(filteredGames[i]));
+            }
+            if (end < total) frag.appendChild(spacerRow((total - end) * height));
+            tbody.replaceChildren(frag);
+
+            if (!rowHeight && end > start) {
+                rowHeight = tbody.children[start > 0 ? 1 : 0].getBoundingClientRect().height;
+                if (rowHeight && rowHeight !== height) renderRows();
+            }
+        }
+
+        function spacerRow(px) {
+            const tr = document.createElement('tr');
+            tr.className = 'spacer';
+            const td = document.createElement('td');
+            td.colSpan = 8;
+            td.style.height = px + 'px';
+            tr.appendChild(td);
+            return tr;
+        }
+
+        // Rows depend only on their game, so each is built once and reattached
+        // on later renders; only the visible slice is ever in the table at once
+        const rowCache = new Map();
+
+        function gameRow(game) {
+            let tr = rowCache.get(game);
+            if (tr) return tr;
+            tr = document.createElement('tr');
+            tr.className = 'tier-' + (game.tier || 'unknown');
+            tr.append(
+                textCell(game.year),
+                textCell(capitalize(game.sport)),
+                textCell(game.division),
+                textCell(game.round),
+                teamCell(game.team1, game.team1_seed),
+                teamCell(game.team2, game.team2_seed),
+                textCell(game.distance_miles !== null ? game.distance_miles + ' mi' : 'N/A'),
+                badgeCell(game.location, game.neutral_site ? 'NEUTRAL' : null, 'neutral-badge')
+            );
+            rowCache.set(game, tr);
+            return tr;
+        }
+
+        function textCell(text) {
+            const td = document.createElement('td');
+            td.textContent = text;
+            return td;
+        }
+
+        function badgeCell(text, badge, badgeClass) {
+            const td = textCell(text);
+            if (badge) {
+                const span = document.createElement('span');
+                span.className = badgeClass;
+                span.textContent = badge;
+                td.appendChild(span);
+            }
+            return td;
+        }
+
+        function teamCell(team, seed) {
+            const td = document.createElement('td');
+            if (seed) {
+                const span = document.createElement('span');
+                span.className = 'seed';
+                span.textContent = '#' + seed;
+                td.append(span, ' ');
+            }
+            td.append(team);
+            return td;
+        }
+
+        // Typed columns for updateStats, indexed like allGames: distance (NaN
+        // when unknown) and a tier code. The loop then reads unboxed numbers
+        // instead of loading properties off each game object.
+        const TIER_OTHER = 0, TIER_GREEN_CODE = 1, TIER_RED_CODE = 2;
+        let statColumns = null;
+
+        function buildStatColumns() {
+            const n = allGames.length;
+            const distance = new Float64Array(n);
+            const tier = new Uint8Array(n);
+            for (let i = 0; i < n; i++) {
+                const g = allGames[i];
+                distance[i] = g.distance_miles === null ? NaN : g.distance_miles;
+                tier[i] = g.tier === 'green' ? TIER_GREEN_CODE : g.tier === 'red' ? TIER_RED_CODE : TIER_OTHER;
+            }
+            statColumns = { distance, tier };
+        }
+
         function updateStats() {
+            if (!statColumns) buildStatColumns();
+            const { distance, tier } = statColumns;
             const total = filteredGames.length;
-            const withDistance = filteredGames.filter(g => g.distance_miles !== null);
-            const avgDist = withDistance.length > 0
-                ? (withDistance.reduce((sum, g) => sum + g.distance_miles, 0) / withDistance.length).toFixed(1)
-                : 0;
-
-            const greenCount = filteredGames.filter(g => g.tier === 'green').length;
-            const redCount = filteredGames.filter(g => g.tier === 'red').length;
-
-            document.getElementById('total-games').textContent = total;
-            document.getElementById('avg-distance').textContent = avgDist;
-            document.getElementById('green-pct').textContent = total > 0 ? Math.round(greenCount / total * 100) + '%' : '0%';
-            document.getElementById('red-pct').textContent = total > 0 ? Math.round(redCount / total * 100) + '%' : '0%';
+            let distSum = 0, distCount = 0, greenCount = 0, redCount = 0;
+            for (let k = 0; k < total; k++) {
+                const i = matchingIdx ? matchingIdx[k] : k;
+                const d = distance[i];
+                if (!Number.isNaN(d)) {
+                    distSum += d;
+                    distCount++;
+                }
+                if (tier[i] === TIER_GREEN_CODE) greenCount++;
+                else if (tier[i] === TIER_RED_CODE) redCount++;
+            }
+            const avgDist = distCount > 0 ? (distSum / distCount).toFixed(1) : 0;
+
+            els.totalGames.textContent = total;
+            els.avgDistance.textContent = avgDist;
+            els.greenPct.textContent = total > 0 ? Math.round(greenCount / total * 100) + '%' : '0%';
+            els.redPct.textContent = total > 0 ? Math.round(redCount / total * 100) + '%' : '0%';
         }
 
         function capitalize(str) {
             return str.charAt(0).toUpperCase() + str.slice(1);
         }
 
+        const NEEDS_QUOTE_RE = /[",\\n]/;
+        const QUOTE_RE = /"/g;
+
+        function csvCell(cell) {
+            const str = String(cell);
+            return NEEDS_QUOTE_RE.test(str) ? '"' + str.replace(QUOTE_RE, '""') + '"' : str;
+        }
+
         function downloadCSV() {
             if (filteredGames.length === 0) {
                 alert('No data to download');
@@ -1478,24 +1802,17 @@ def generate_html(games: list[Game], output_file: str = "brackets.html"):
             }
 
             const headers = ['Year', 'Sport', 'Division', 'Round', 'Team 1', 'Seed 1', 'Team 2', 'Seed 2', 'Distance (mi)', 'Location', 'Neutral Site', 'Tier'];
-            const rows = filteredGames.map(g => [
-                g.year, g.sport, g.division, g.round,
-                g.team1, g.team1_seed || '', g.team2, g.team2_seed || '',
-                g.distance_miles || '', g.location, g.neutral_site ? 'Yes' : 'No', g.tier
-            ]);
-
-            let csv = headers.join(',') + '\\n';
-            rows.forEach(row => {
-                csv += row.map(cell => {
-                    const str = String(cell);
-                    if (str.includes(',') || str.includes('"') || str.includes('\\n')) {
-                        return '"' + str.replace(/"/g, '""') + '"';
-                    }
-                    return str;
-                }).join(',') + '\\n';
-            });
+            const lines = [headers.join(',')];
+            for (const g of filteredGames) {
+                lines.push([
+                    g.year, g.sport, g.division, g.round,
+                    g.team1, g.team1_seed || '', g.team2, g.team2_seed || '',
+                    g.distance_miles || '', g.location, g.neutral_site ? 'Yes' : 'No', g.tier
+                ].map(csvCell).join(','));
+            }
+            lines.push('');
 
-            const blob = new Blob([csv], { type: 'text/csv' });
+            const blob = new Blob([lines.join('\\n')], { type: 'text/csv' });
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
@@ -1506,40 +1823,127 @@ def generate_html(games: list[Game], output_file: str = "brackets.html"):
             URL.revokeObjectURL(url);
         }
 
-        // Event listeners
-        document.querySelectorAll('.filters select').forEach(select => {
-            select.addEventListener('change', filterGames);
-        });
-
-        document.querySelectorAll('th[data-sort]').forEach(th => {
-            th.addEventListener('click', () => {
-                const column = th.dataset.sort;
-                if (sortColumn === column) {
-                    sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
+        // Bursts of filter changes and header clicks (arrow keys held on a
+        // select, repeated clicks) run at most one update per animation frame
+        let updateQueued = false;
+        let refilterQueued = false;
+
+        function scheduleUpdate(refilter) {
+            refilterQueued = refilterQueued || refilter;
+            if (updateQueued) return;
+            updateQueued = true;
+            requestAnimationFrame(() => {
+                updateQueued = false;
+                if (refilterQueued) {
+                    refilterQueued = false;
+                    filterGames();
                 } else {
-                    sortColumn = column;
-                    sortDirection = 'asc';
+                    sortGames();
+                    renderTable();
                 }
-                sortGames();
-                renderTable();
+            });
+        }
+
+        // Event listeners, delegated to the filter bar and the table header
+        document.querySelector('.filters').addEventListener('change', e => {
+            if (e.target.matches('select')) scheduleUpdate(true);
+        });
+
+        document.querySelector('#games-table thead').addEventListener('click', e => {
+            const th = e.target.closest('th[data-sort]');
+            if (!th) return;
+            const column = th.dataset.sort;
+            if (sortColumn === column) {
+                sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn = column;
+                sortDirection = 'asc';
+            }
+            scheduleUpdate(false);
+        });
+
+        let scrollQueued = false;
+        els.scroll.addEventListener('scroll', () => {
+            if (scrollQueued || filteredGames.length === 0) return;
+            scrollQueued = true;
+            requestAnimationFrame(() => {
+                scrollQueued = false;
+                renderRows();
             });
         });
 
         // Initial render
-        filterGames();
+        if (Array.isArray(gamesData)) {
+            filterGames();
+        } else {
+            fetch(gamesData)
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status} for ${gamesData}`);
+                    return response.json();
+                })
+                .then(games => {
+                    allGames = games;
+                    sortCache.clear();
+                    keyedFor = null;
+                    filterIndex = null;
+                    statColumns = null;
+                    rowCache.clear();
+                    filterGames();
+                })
+                .catch(err => {
+                    // Missing data file, or a file:// page where fetch() is blocked
+                    const td = textCell(`Could not load game data (${err.message}). This page must be served over HTTP.`);
+                    td.colSpan = 8;
+                    td.className = 'no-data';
+                    const tr = document.createElement('tr');
+                    tr.appendChild(td);
+                    els.tbody.replaceChildren(tr);
+                });
+        }
     </script>
 </body>
 </html>
 '''
 
-    with open(output_file, "w") as f:
-        f.write(html_template)
-
-    print(f"Generated {output_file} with {len(games)} games")
+# Split once at import so generate_html() can stream the data between the halves
+_HTML_HEAD, _HTML_TAIL = _HTML_TEMPLATE.split("__GAMES_JSON__")
+
+
+def generate_html(rows: list[dict], output_file: str = "brackets.html",
+                  external_data: bool = False):
+    """Generate static HTML file with interactive table from Game.to_dict() rows.
+
+    With external_data the games go to a content-hashed games.<hash>.json next
+    to the page, which browsers can cache across visits. The page then needs
+    to be served over HTTP; fetch() is blocked for file:// pages.
+    """
+    if external_data:
+        data = orjson.dumps(rows) if HAS_ORJSON else json.dumps(rows, separators=(",", ":")).encode()
+        data_file = Path(output_file).with_name(f"games.{hashlib.sha1(data).hexdigest()[:8]}.json")
+        data_file.write_bytes(data)
+        print(f"Wrote {data_file}")
+        print(f"Note: {output_file} loads {data_file.name} with fetch(), so serve it over HTTP "
+              f"(e.g. python -m http.server); opened straight from disk it can only show a load error")
+
+    # Stream the page: the games JSON goes straight to the file between the
+    # template halves instead of being spliced into one big string first. The
+    # 1 MiB buffer keeps json.dump's many small chunks from each hitting the OS
+    with open(output_file, "w", buffering=1 << 20) as f:
+        f.write(_HTML_HEAD)
+        if external_data:
+            f.write(json.dumps(data_file.name))
+        elif HAS_ORJSON:
+            f.write(orjson.dumps(rows).decode())
+        else:
+            json.dump(rows, f, separators=(",", ":"))
+        f.write(_HTML_TAIL)
+
+    print(f"Generated {output_file} with {len(rows)} games")
 
 
 def main():
     """Main entry point."""
+    global ALLOW_GEOCODE
     import argparse
 
     parser = argparse.ArgumentParser(description="OSAA Playoff Brackets - Long-Haul Matchups Tracker")
@@ -1548,12 +1952,19 @@ def main():
     parser.add_argument("--json", type=str, default="bracket_data.json", help="JSON data file to load")
     parser.add_argument("--csv", type=str, default="osaa_brackets.csv", help="CSV output filename")
     parser.add_argument("--html", type=str, default="brackets.html", help="HTML output filename")
+    parser.add_argument("--external-data", action="store_true",
+                        help="Write games to a cacheable games.<hash>.json next to the HTML")
+    parser.add_argument("--workers", type=int, default=SCRAPE_WORKERS,
+                        help="Concurrent bracket page requests when scraping")
+    parser.add_argument("--geocode", action="store_true",
+                        help="Look up schools missing from schools.json with Nominatim")
 
     args = parser.parse_args()
+    ALLOW_GEOCODE = args.geocode
 
     if args.scrape:
         print("Scraping OSAA brackets...")
-        games = scrape_all_brackets()
+        games = scrape_all_brackets(args.workers)
     elif args.sample:
         print("Generating sample data...")
         games = generate_sample_data()
@@ -1568,18 +1979,19 @@ def main():
     print(f"\nTotal long-haul games (95+ mi): {len(games)}")
 
     # Show breakdown by tier
-    green = sum(1 for g in games if g.tier == "green")
-    yellow = sum(1 for g in games if g.tier == "yellow")
-    red = sum(1 for g in games if g.tier == "red")
-    print(f"  Green (95-119 mi): {green}")
-    print(f"  Yellow (120-249 mi): {yellow}")
-    print(f"  Red (250+ mi): {red}")
+    tier_counts = Counter(map(attrgetter("tier"), games))
+    print(f"  Green (95-119 mi): {tier_counts['green']}")
+    print(f"  Yellow (120-249 mi): {tier_counts['yellow']}")
+    print(f"  Red (250+ mi): {tier_counts['red']}")
+
+    # Both outputs share one dict per game
+    rows = [game.to_dict() for game in games]
 
     # Export to CSV
-    export_to_csv(games, args.csv)
+    export_to_csv(rows, args.csv)
 
     # Generate HTML
-    generate_html(games, args.html)
+    generate_html(rows, args.html, external_data=args.external_data)
 
     print("\nDone!")
 
@@ -7,11 +7,31 @@ import re
 import json
 from pathlib import Path
 
+# Patterns used while parsing the bracket text, compiled once at import
+_RE_HEADER = re.compile(r'^(\d{4})\s+OSAA.*\s+(2A/1A|3A|4A|5A|6A)\s+(Baseball|Softball)\s+State\s+Championship')
+_RE_ROUND = re.compile(r'^(Round\s+\d+|First\s+Round|Second\s+Round|Quarterfinals?|Semifinals?|Finals?|Championship|Round\s+of\s+\d+)\s*', re.IGNORECASE)
+# First letters of Round/First/Second/Quarterfinal/Semifinal/Final/Championship
+_ROUND_INITIALS = frozenset('RFSQCrfsqc')
+_RE_DATE = re.compile(r'^(\d{1,2}/\d{1,2})')
+_RE_LOCATION = re.compile(r'@\s*(.+)$')
+_RE_INT = re.compile(r'^\d+$')
+_RE_INNINGS = re.compile(r'^\d+\s*(inn|innings?)?\s*$', re.IGNORECASE)
+_RE_SCORE_PAIR = re.compile(r'^\d+\s+\d+$')
+_RE_NUMERIC = re.compile(r'^[\d\s]+$')
+_RE_ROUND_LABEL = re.compile(r'^(Round|Quarterfinal|Semifinal|Final|Championship)', re.IGNORECASE)
+_RE_TRAILING_SCORE = re.compile(r'\s+\d+-\d+\s*$')
+
+# Game notes that show up where a team name is expected
+_INNINGS_NOTES = frozenset({
+    '5 innings', '6 inn', '6 innings', '7 inn', '8 innings', '9 inn', '10 run rule', '5 inn.', '5 inn',
+})
+
 
 def parse_bracket_file(filename: str) -> list[dict]:
     """Parse the raw bracket text file and extract all matchups."""
     with open(filename, 'r') as f:
-        lines = [line.rstrip() for line in f.readlines()]
+        # Iterate the file directly (no readlines() copy) and strip each line once
+        lines = [line.strip() for line in f]
 
     matchups = []
     current_year = None
@@ -21,10 +41,14 @@ def parse_bracket_file(filename: str) -> list[dict]:
 
     i = 0
     while i < len(lines):
-        line = lines[i].strip()
+        line = lines[i]
+        # Headers and dates start with a digit and round labels with one of a
+        # few letters, so most lines never reach a regex
+        first = line[:1]
+        starts_with_digit = first.isdigit()
 
         # Check for header line (year/sport/division)
-        header_match = re.match(r'^(\d{4})\s+OSAA.*\s+(2A/1A|3A|4A|5A|6A)\s+(Baseball|Softball)\s+State\s+Championship', line)
+        header_match = starts_with_digit and _RE_HEADER.match(line)
         if header_match:
             current_year = int(header_match.group(1))
             current_division = header_match.group(2)
@@ -33,21 +57,22 @@ def parse_bracket_file(filename: str) -> list[dict]:
             continue
 
         # Check for round labels
-        round_match = re.match(r'^(Round\s+\d+|First\s+Round|Second\s+Round|Quarterfinals?|Semifinals?|Finals?|Championship|Round\s+of\s+\d+)\s*', line, re.IGNORECASE)
+        round_match = first in _ROUND_INITIALS and _RE_ROUND.match(line)
         if round_match:
             round_text = round_match.group(1).strip()
+            round_lower = round_text.lower()
             # Normalize round names
-            if 'round 1' in round_text.lower() or 'first round' in round_text.lower():
+            if 'round 1' in round_lower or 'first round' in round_lower:
                 current_round = 'First Round'
-            elif 'round 2' in round_text.lower() or 'second round' in round_text.lower():
+            elif 'round 2' in round_lower or 'second round' in round_lower:
                 current_round = 'Second Round'
-            elif 'quarterf' in round_text.lower():
+            elif 'quarterf' in round_lower:
                 current_round = 'Quarterfinals'
-            elif 'semif' in round_text.lower():
+            elif 'semif' in round_lower:
                 current_round = 'Semifinals'
-            elif 'final' in round_text.lower() or 'championship' in round_text.lower():
+            elif 'final' in round_lower or 'championship' in round_lower:
                 current_round = 'Championship'
-            elif 'round of' in round_text.lower():
+            elif 'round of' in round_lower:
                 current_round = round_text
             else:
                 current_round = round_text
@@ -55,7 +80,7 @@ def parse_bracket_file(filename: str) -> list[dict]:
             continue
 
         # Check for date/time line (5/21, 5pm or similar)
-        date_match = re.match(r'^(\d{1,2}/\d{1,2})', line)
+        date_match = starts_with_digit and _RE_DATE.match(line)
         if date_match and current_year and current_sport and current_division:
             # Next 2 lines should be team names
             team1 = None
@@ -64,32 +89,31 @@ def parse_bracket_file(filename: str) -> list[dict]:
             location = ""
 
             # Check for location in the date line
-            loc_match = re.search(r'@\s*(.+)$', line)
+            loc_match = _RE_LOCATION.search(line)
             if loc_match:
                 location = loc_match.group(1).strip()
 
             i += 1
             # Get team 1
             if i < len(lines):
-                team1 = lines[i].strip()
+                team1 = lines[i]
                 # Skip if it's just a number or empty
-                while team1 and (re.match(r'^\d+$', team1) or team1 == ''):
+                while team1 and (_RE_INT.match(team1) or team1 == ''):
                     i += 1
                     if i < len(lines):
-                        team1 = lines[i].strip()
+                        team1 = lines[i]
                     else:
                         break
                 i += 1
 
             # Get team 2
             if i < len(lines):
-                team2 = lines[i].strip()
+                team2 = lines[i]
                 # Skip innings notes
-                while team2 and (re.match(r'^\d+\s*(inn|innings?)?\s*$', team2, re.IGNORECASE) or
-                                 team2 in ['5 innings', '6 inn', '6 innings', '7 inn', '8 innings', '9 inn', '10 run rule', '5 inn.']):
+                while team2 and (_RE_INNINGS.match(team2) or team2 in _INNINGS_NOTES):
                     i += 1
                     if i < len(lines):
-                        team2 = lines[i].strip()
+                        team2 = lines[i]
                     else:
                         break
                 i += 1
@@ -97,7 +121,7 @@ def parse_bracket_file(filename: str) -> list[dict]:
             # Validate teams
             if team1 and team2 and len(team1) > 2 and len(team2) > 2:
                 # Skip if either is a score pattern
-                if not re.match(r'^\d+\s+\d+$', team1) and not re.match(r'^\d+\s+\d+$', team2):
+                if not _RE_SCORE_PAIR.match(team1) and not _RE_SCORE_PAIR.match(team2):
                     # Clean up team names
                     team1 = clean_team_name(team1)
                     team2 = clean_team_name(team2)
@@ -129,26 +153,26 @@ def clean_team_name(name: str) -> str:
     name = name.strip()
 
     # Skip if it's a date pattern
-    if re.match(r'^\d{1,2}/\d{1,2}', name):
+    if _RE_DATE.match(name):
         return None
 
     # Skip if it's just numbers or a score
-    if re.match(r'^[\d\s]+$', name):
+    if _RE_NUMERIC.match(name):
         return None
 
     # Skip innings notes
-    if re.match(r'^\d+\s*(inn|innings?)?\s*$', name, re.IGNORECASE):
+    if _RE_INNINGS.match(name):
         return None
 
-    if name in ['5 innings', '6 inn', '6 innings', '7 inn', '8 innings', '9 inn', '10 run rule', '5 inn.', '5 inn']:
+    if name in _INNINGS_NOTES:
         return None
 
     # Skip Round labels
-    if re.match(r'^(Round|Quarterfinal|Semifinal|Final|Championship)', name, re.IGNORECASE):
+    if _RE_ROUND_LABEL.match(name):
         return None
 
     # Remove trailing score patterns
-    name = re.sub(r'\s+\d+-\d+\s*$', '', name)
+    name = _RE_TRAILING_SCORE.sub('', name)
 
     # Truncate overly long lines (likely notes/explanations)
     if len(name) > 50: